@@ -18,7 +18,7 @@ import argparse
 import os
 import sys
 from argparse import REMAINDER
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 import google.auth._cloud_sdk as csdk
 from absl.flags import argparse_flags
@@ -30,7 +30,6 @@ import caliban.platform.cloud.types as ct
 import caliban.platform.gke as gke
 import caliban.platform.gke.constants as gke_k
 import caliban.platform.gke.types as gke_t
-import caliban.platform.gke.util as gke_u
 import caliban.util as u
 import caliban.util.argparse as ua
 import caliban.util.schema as us
@@ -393,8 +392,49 @@ def cloud_parser(base):
   return
 
 
-def caliban_parser():
-  """Creates and returns the argparse instance for the entire Caliban app."""
+def _sniff_command(argv: Optional[List[str]],
+                   commands: Dict[str, Any]) -> Optional[str]:
+  """Returns the command named by the first positional argument in argv, or
+  None if argv is missing or doesn't start with one of the supplied commands.
+
+  """
+  if argv is None:
+    return None
+
+  cmd = next((a for a in argv if not a.startswith("-")), None)
+  if cmd not in commands:
+    return None
+
+  # help requested before the command lists every command, with its help
+  if any(a in ("-h", "--help", "--helpfull") for a in argv[:argv.index(cmd)]):
+    return None
+
+  return cmd
+
+
+def _add_command_parsers(base, commands: Dict[str, Any], cmd: Optional[str],
+                         build: Callable[[Any], None]) -> None:
+  """Adds a parser for each of the supplied commands to the base subparsers.
+
+  If cmd names one of the commands, only its parser is fully built via build,
+  and every other command gets an empty stub parser, so that usage lines still
+  list every command. Otherwise every parser is built.
+
+  """
+  for name, builder in commands.items():
+    if cmd is None or name == cmd:
+      build(builder)
+    else:
+      base.add_parser(name)
+
+
+def caliban_parser(argv: Optional[List[str]] = None):
+  """Creates and returns the argparse instance for the entire Caliban app.
+
+  If supplied, argv is used to skip building parsers for commands that won't
+  be used.
+
+  """
 
   parser = argparse_flags.ArgumentParser(description="""Docker and AI
   Platform model training and development script. For detailed
@@ -407,15 +447,14 @@ def caliban_parser():
   subparser = parser.add_subparsers(dest="command")
   subparser.required = True
 
-  shell_parser(subparser)
-  notebook_parser(subparser)
-  local_build_parser(subparser)
-  local_run_parser(subparser)
-  cloud_parser(subparser)
-  cluster_parser(subparser)
-  status_parser(subparser)
-  stop_parser(subparser)
-  resubmit_parser(subparser)
+  def build(builder):
+    if builder is cluster_parser:
+      cluster_parser(subparser, argv)
+    else:
+      builder(subparser)
+
+  _add_command_parsers(subparser, _COMMANDS, _sniff_command(argv, _COMMANDS),
+                       build)
 
   return parser
 
@@ -524,7 +563,7 @@ def parse_flags(argv):
 
   """
   args = argv[1:]
-  ret = caliban_parser().parse_args(args)
+  ret = caliban_parser(args).parse_args(args)
 
   # Validate that extra script args were properly parsed.
   validate_script_args(args, vars(ret).get("script_args", []))
@@ -568,20 +607,27 @@ def generate_docker_args(job_mode: conf.JobMode,
 
 
 # ----------------------------------------------------------------------------
-def cluster_parser(base):
-  """cli parser for cluster commands"""
+def cluster_parser(base, argv: Optional[List[str]] = None):
+  """cli parser for cluster commands
+
+  If argv names a valid cluster subcommand, only that subcommand's parser is
+  fully built (see _add_command_parsers).
+  """
 
   parser = base.add_parser("cluster",
                            description="cluster commands",
                            help="cluster-related commands")
 
   subparser = parser.add_subparsers(dest="cluster_cmd")
-  cluster_ls_cmd(subparser)
-  cluster_pod_parser(subparser)
-  cluster_job_parser(subparser)
-  cluster_node_pool_parser(subparser)
-  cluster_create_cmd(subparser)
-  cluster_delete_cmd(subparser)
+
+  if argv is not None and "cluster" in argv:
+    argv = argv[argv.index("cluster") + 1:]
+  else:
+    argv = None
+
+  _add_command_parsers(subparser, _CLUSTER_CMDS,
+                       _sniff_command(argv, _CLUSTER_CMDS),
+                       lambda builder: builder(subparser))
 
 
 # ----------------------------------------------------------------------------
@@ -604,6 +650,15 @@ def cluster_name_arg(parser):
   parser.add_argument("--cluster_name", help="cluster name", type=str)
 
 
+# ----------------------------------------------------------------------------
+def label_selector_arg(parser):
+  parser.add_argument(
+      "--label_selector",
+      help="kubernetes label selector, e.g. 'app=x,env!=y', applied by the "
+      "cluster to filter listed objects",
+      type=str)
+
+
 # ----------------------------------------------------------------------------
 def zone_arg(parser, default=None, help='zone'):
   parser.add_argument("--zone", help=help, type=str, default=default)
@@ -628,6 +683,7 @@ def cluster_pod_ls_cmd(base):
   cloud_key_arg(parser)
   cluster_name_arg(parser)
   zone_arg(parser)
+  label_selector_arg(parser)
 
 
 # ----------------------------------------------------------------------------
@@ -655,6 +711,7 @@ def cluster_job_ls_cmd(base):
   cloud_key_arg(parser)
   cluster_name_arg(parser)
   zone_arg(parser)
+  label_selector_arg(parser)
 
 
 # ----------------------------------------------------------------------------
@@ -685,16 +742,25 @@ def cluster_job_submit_cmd(base):
   nonpreemptible_arg(parser)
   dry_run_arg(parser)
   job_export_arg(parser)
+  submit_concurrency_arg(parser)
   xgroup_submit_arg(parser)
 
   require_module(parser)
   add_script_args(parser)
 
 
+# ----------------------------------------------------------------------------
+def _validate_job_filename(s: str) -> str:
+  """argparse type for kubernetes job files, the gke utilities are slow to
+  import, so they're only imported when a job file argument is parsed"""
+  import caliban.platform.gke.util as gke_u
+  return gke_u.validate_job_filename(s)
+
+
 # ----------------------------------------------------------------------------
 def job_file_arg(parser):
   parser.add_argument('job_file',
-                      type=gke_u.validate_job_filename,
+                      type=_validate_job_filename,
                       help='kubernetes k8s job file {}'.format(
                           gke_k.VALID_JOB_FILE_EXT))
 
@@ -703,7 +769,7 @@ def job_file_arg(parser):
 def job_export_arg(parser):
   parser.add_argument(
       '--export',
-      type=gke_u.validate_job_filename,
+      type=_validate_job_filename,
       help=('Export job spec(s) to file, extension must be one of ' +
             '{} (for example: --export my-job-spec.yaml) '.format(
                 gke_k.VALID_JOB_FILE_EXT) +
@@ -713,6 +779,15 @@ def job_export_arg(parser):
             'my-job-spec_0.yaml, my-job-spec_1.yaml...)'))
 
 
+# ----------------------------------------------------------------------------
+def submit_concurrency_arg(parser):
+  parser.add_argument(
+      '--submit_concurrency',
+      type=ua.positive_int,
+      default=gke_k.JOB_SUBMIT_MAX_WORKERS,
+      help='Maximum number of jobs to submit to the cluster concurrently.')
+
+
 # ----------------------------------------------------------------------------
 def cluster_job_submit_file_cmd(base):
   parser = base.add_parser(
@@ -827,6 +902,18 @@ def cluster_delete_cmd(base):
   zone_arg(parser)
 
 
+# ----------------------------------------------------------------------------
+# maps cluster subcommand names to their parser builders, in help order
+_CLUSTER_CMDS = {
+    'ls': cluster_ls_cmd,
+    'pod': cluster_pod_parser,
+    'job': cluster_job_parser,
+    'node_pool': cluster_node_pool_parser,
+    'create': cluster_create_cmd,
+    'delete': cluster_delete_cmd,
+}
+
+
 # ----------------------------------------------------------------------------
 def release_channel_arg(parser):
   parser.add_argument(
@@ -946,3 +1033,18 @@ def max_jobs_arg(parser):
             f'then this specifies the total number of jobs to return, ordered '
             f'by creation date, or all jobs if max_jobs==0.'),
   )
+
+
+# ----------------------------------------------------------------------------
+# maps top-level command names to their parser builders, in help order
+_COMMANDS = {
+    "shell": shell_parser,
+    "notebook": notebook_parser,
+    "build": local_build_parser,
+    "run": local_run_parser,
+    "cloud": cloud_parser,
+    "cluster": cluster_parser,
+    "status": status_parser,
+    "stop": stop_parser,
+    "resubmit": resubmit_parser,
+}
@@ -24,7 +24,7 @@ import itertools
 import re
 import sys
 from collections import ChainMap
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import commentjson
 
@@ -141,17 +141,26 @@ def expand_compound_dict(m: Union[Dict, List]) -> Union[Dict, List]:
     return dict(ChainMap(*expanded_dicts))
 
 
-def expand_experiment_config(items: ExpConf) -> List[Experiment]:
-  """Expand out the experiment config for job submission to Cloud.
+def iter_experiment_config(items: ExpConf) -> Iterator[Experiment]:
+  """Lazily expand out the experiment config for job submission to Cloud.
+
+  Each experiment is generated as it is consumed, so large sweeps are never
+  held in memory all at once.
 
   """
   if isinstance(items, list):
-    return list(
-        itertools.chain.from_iterable(
-            [expand_experiment_config(m) for m in items]))
+    return itertools.chain.from_iterable(
+        iter_experiment_config(m) for m in items)
 
   tupleized_items = tupleize_dict(items)
-  return [expand_compound_dict(d) for d in u.dict_product(tupleized_items)]
+  return (expand_compound_dict(d) for d in u.dict_product(tupleized_items))
+
+
+def expand_experiment_config(items: ExpConf) -> List[Experiment]:
+  """Expand out the experiment config for job submission to Cloud.
+
+  """
+  return list(iter_experiment_config(items))
 
 
 def validate_compound_keys(m: ExpConf) -> ExpConf:
@@ -259,7 +268,7 @@ def validate_experiment_config(items: ExpConf) -> ExpConf:
     raise argparse.ArgumentTypeError("The experiment config is invalid! \
     The JSON file must contain either a dict or a list.")
 
-  for item in expand_experiment_config(items):
+  for item in iter_experiment_config(items):
     validate_expansion(item)
   return items
 
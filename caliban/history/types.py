@@ -25,7 +25,7 @@ import sqlalchemy
 from sqlalchemy import (JSON, Column, DateTime, ForeignKey, Integer, String)
 from sqlalchemy.engine.base import Engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import Session, backref, relationship, sessionmaker
+from sqlalchemy.orm import Session, relationship
 from sqlalchemy.orm.session import object_session
 
 from caliban.util import current_user
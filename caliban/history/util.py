@@ -18,7 +18,7 @@ import os
 import sys
 from contextlib import contextmanager
 from copy import deepcopy
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from absl import logging
 from blessings import Terminal
@@ -222,17 +222,47 @@ def create_experiments(
   xgroup: experiment group name for the generated experiments
   '''
 
+  return list(
+      iter_experiments(
+          session=session,
+          container_spec=container_spec,
+          script_args=script_args,
+          experiment_config=experiment_config,
+          xgroup=xgroup,
+      ))
+
+
+# ----------------------------------------------------------------------------
+def iter_experiments(
+    session: Session,
+    container_spec: ContainerSpec,
+    script_args: List[str],
+    experiment_config: ce.ExpConf,
+    xgroup: Optional[str] = None,
+) -> Iterator[Experiment]:
+  '''lazily create experiment instances
+
+  This is the streaming equivalent of create_experiments, the experiment
+  config is expanded and each experiment created as it is consumed.
+
+  Args:
+  session: sqlalchemy session
+  container_spec: container spec for the generated experiments
+  script_args: extra arguments passed to every job, see create_experiments
+  experiment_config: experiment config, see create_experiments
+  xgroup: experiment group name for the generated experiments
+  '''
+
   xg = ExperimentGroup.get_or_create(session=session, name=xgroup)
   session.add(xg)  # this ensures that any new objects get persisted
 
-  return [
-      Experiment.get_or_create(
-          xgroup=xg,
-          container_spec=container_spec,
-          args=script_args,
-          kwargs=kwargs,
-      ) for kwargs in ce.expand_experiment_config(experiment_config)
-  ]
+  for kwargs in ce.iter_experiment_config(experiment_config):
+    yield Experiment.get_or_create(
+        xgroup=xg,
+        container_spec=container_spec,
+        args=script_args,
+        kwargs=kwargs,
+    )
 
 
 # ----------------------------------------------------------------------------
@@ -20,23 +20,8 @@ from __future__ import absolute_import, division, print_function
 import logging as ll
 import sys
 
-from absl import app, logging
 from blessings import Terminal
 
-import caliban.cli as cli
-import caliban.config as c
-import caliban.docker.build as b
-import caliban.history.cli
-import caliban.platform.cloud.core as cloud
-import caliban.platform.cloud.util as cu
-import caliban.platform.gke as gke
-import caliban.platform.gke.cli
-import caliban.platform.notebook as pn
-import caliban.platform.run as pr
-import caliban.platform.shell as ps
-import caliban.util.schema as cs
-
-ll.getLogger('caliban.main').setLevel(logging.ERROR)
 t = Terminal()
 
 
@@ -45,19 +30,28 @@ def run_app(arg_input):
   argparse argument parser.
 
   """
+  from absl import logging
+
+  import caliban.cli as cli
+  import caliban.config as c
+
   args = vars(arg_input)
   script_args = c.extract_script_args(args)
 
   command = args["command"]
 
+  # command handlers pull in slow-to-import cloud and kubernetes libraries, so
+  # only the handler for the requested command is imported.
   if command == "cluster":
-    return gke.cli.run_cli_command(args)
+    import caliban.platform.gke.cli as gke_cli
+    return gke_cli.run_cli_command(args)
 
   job_mode = cli.resolve_job_mode(args)
   docker_args = cli.generate_docker_args(job_mode, args)
   docker_run_args = args.get("docker_run_args", [])
 
   if command == "shell":
+    import caliban.platform.shell as ps
     mount_home = not args['bare']
     image_id = args.get("image_id")
     shell = args['shell']
@@ -69,6 +63,7 @@ def run_app(arg_input):
                        **docker_args)
 
   elif command == "notebook":
+    import caliban.platform.notebook as pn
     port = args.get("port")
     lab = args.get("lab")
     version = args.get("jupyter_version")
@@ -82,19 +77,24 @@ def run_app(arg_input):
                     **docker_args)
 
   elif command == "build":
+    import caliban.docker.build as b
     package = args["module"]
     b.build_image(job_mode, package=package, **docker_args)
 
   elif command == 'status':
-    caliban.history.cli.get_status(args)
+    import caliban.history.cli as hc
+    hc.get_status(args)
 
   elif command == 'stop':
-    caliban.history.cli.stop(args)
+    import caliban.history.cli as hc
+    hc.stop(args)
 
   elif command == 'resubmit':
-    caliban.history.cli.resubmit(args)
+    import caliban.history.cli as hc
+    hc.resubmit(args)
 
   elif command == "run":
+    import caliban.platform.run as pr
     dry_run = args["dry_run"]
     package = args["module"]
     image_id = args.get("image_id")
@@ -112,6 +112,8 @@ def run_app(arg_input):
                        **docker_args)
 
   elif command == "cloud":
+    import caliban.platform.cloud.core as cloud
+    import caliban.platform.cloud.util as cu
     project_id = c.extract_project_id(args)
     region = c.extract_region(args)
     cloud_key = c.extract_cloud_key(args)
@@ -153,6 +155,20 @@ def run_app(arg_input):
 
 
 def main():
+  # `caliban --version` is answered before importing absl and the cli, which
+  # account for nearly all of caliban's startup time.
+  if sys.argv[1:] == ["--version"]:
+    from caliban import __version__
+    print("caliban {}".format(__version__))
+    return
+
+  from absl import app, logging
+
+  import caliban.cli as cli
+  import caliban.docker.build as b
+  import caliban.util.schema as cs
+
+  ll.getLogger('caliban.main').setLevel(logging.ERROR)
   logging.use_python_logging()
   try:
     with cs.fatal_errors():
@@ -396,7 +396,7 @@ def _job_spec(
     experiment: ht.Experiment,
 ) -> ht.JobSpec:
   """Returns the final object required by the Google AI Platform training job
-  submission endpoint.
+  submission endpoint. `labels` must already be sanitized.
 
   """
   job_id = f'{job_name}_{idx}'
@@ -407,7 +407,7 @@ def _job_spec(
           "jobId": job_id,
           "trainingInput": training_input,
           "labels": {
-              **cu.sanitize_labels(labels),
+              **labels,
               **cu.script_args_to_labels(job_args)
           }
       },
@@ -433,6 +433,9 @@ def _job_specs(
   """
   caliban_config = caliban_config or {}
 
+  # the user labels are shared by every job, so they're only sanitized once.
+  job_labels = cu.sanitize_labels(labels)
+
   for idx, m in enumerate(experiments, 1):
 
     launcher_args = um.mlflow_args(
@@ -455,7 +458,7 @@ def _job_specs(
                     training_input={
                         **training_input, "args": args
                     },
-                    labels=labels,
+                    labels=job_labels,
                     experiment=m)
 
 
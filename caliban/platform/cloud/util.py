@@ -116,4 +116,6 @@ def sanitize_labels(
   if isinstance(pairs, dict):
     return sanitize_labels(pairs.items())
 
-  return {key_label(k): value_label(v) for (k, v) in pairs if key_label(k)}
+  # each key is only cleaned once
+  cleaned = ((key_label(k), v) for (k, v) in pairs)
+  return {k: value_label(v) for (k, v) in cleaned if k}
@@ -20,11 +20,9 @@ import logging
 import os
 import pprint as pp
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-import googleapiclient
 from google.auth.credentials import Credentials
-from kubernetes.client import V1Job
 
 import caliban.cli as cli
 import caliban.config as conf
@@ -33,11 +31,15 @@ import caliban.platform.gke.constants as k
 import caliban.platform.gke.util as util
 import caliban.util as u
 import caliban.util.metrics as um
-from caliban.history.util import (create_experiments, generate_container_spec,
-                                  get_mem_engine, get_sql_engine, session_scope)
+from caliban.history.util import (generate_container_spec, get_mem_engine,
+                                  get_sql_engine, iter_experiments,
+                                  session_scope)
 from caliban.platform.cloud.core import generate_image_tag
 from caliban.platform.gke.cluster import Cluster
 
+if TYPE_CHECKING:
+  from kubernetes.client import V1Job
+
 
 # ----------------------------------------------------------------------------
 def _project_and_creds(fn):
@@ -114,7 +116,7 @@ def _check_for_existing_cluster(cluster_name: str, project_id: str,
 
 
 # ----------------------------------------------------------------------------
-def _export_jobs(export: str, jobs: List[V1Job]) -> bool:
+def _export_jobs(export: str, jobs: List['V1Job']) -> bool:
   """exports job(s) to file
 
   If there is more than one job in the list, the output filenames are
@@ -158,10 +160,7 @@ def _cluster_create(args: dict, project_id: str, creds: Credentials) -> None:
   single_zone = args['single_zone']
 
   # --------------------------------------------------------------------------
-  cluster_client = googleapiclient.discovery.build('container',
-                                                   k.CLUSTER_API_VERSION,
-                                                   credentials=creds,
-                                                   cache_discovery=False)
+  cluster_client = util.build_api('container', k.CLUSTER_API_VERSION, creds)
 
   if cluster_client is None:
     logging.error('error building cluster client')
@@ -295,13 +294,17 @@ def _pod_ls(args: dict, cluster: Cluster):
   args: commandline args
   cluster: list pods in this cluster
   """
-  pods = cluster.pods()
+  pods = cluster.iter_pods(label_selector=args.get('label_selector'))
   if pods is None:
     return
 
-  logging.info('{} pods found'.format(len(pods)))
+  # names are printed as each page arrives, so the count comes last
+  n = 0
   for p in pods:
     logging.info(p.metadata.name)
+    n += 1
+
+  logging.info('{} pods found'.format(n))
 
   return
 
@@ -316,14 +319,18 @@ def _job_ls(args: dict, cluster: Cluster):
   args: commandline args
   cluster: lists jobs from this cluster
   """
-  jobs = cluster.jobs()
+  jobs = cluster.iter_jobs(label_selector=args.get('label_selector'))
 
   if jobs is None:
     return
 
-  logging.info('{} jobs found'.format(len(jobs)))
+  # names are printed as each page arrives, so the count comes last
+  n = 0
   for j in jobs:
     logging.info(j.metadata.name)
+    n += 1
+
+  logging.info('{} jobs found'.format(n))
 
   return
 
@@ -356,19 +363,21 @@ def _job_submit(args: dict, cluster: Cluster) -> None:
   package = args['module']
   job_name = _generate_job_name(args.get('name'))
   gpu_spec = args.get('gpu_spec')
+  tpu_spec = args.get('tpu_spec')
+  tpu_driver = args.get('tpu_driver')
   preemptible = not args['nonpreemptible']
+  preemptible_tpu = not args.get('nonpreemptible_tpu')
   min_cpu = args.get('min_cpu')
   min_mem = args.get('min_mem')
   experiment_config = args.get('experiment_config') or [{}]
   xgroup = args.get('xgroup')
   image_tag = args.get('image_tag')
   export = args.get('export', None)
+  submit_concurrency = args.get('submit_concurrency', k.JOB_SUBMIT_MAX_WORKERS)
   caliban_config = docker_args.get('caliban_config', {})
 
-  labels = args.get('label')
-  if labels is not None:
-    labels = dict(cu.sanitize_labels(labels))
-  labels = labels or {}
+  raw_labels = args.get('label')
+  labels = cu.sanitize_labels(raw_labels) if raw_labels else {}
 
   # Arguments to internally build the image required to submit to Cloud.
   docker_m = {'job_mode': job_mode, 'package': package, **docker_args}
@@ -383,10 +392,6 @@ def _job_submit(args: dict, cluster: Cluster) -> None:
 
   # --------------------------------------------------------------------------
   # validate tpu spec and driver
-  tpu_spec = args.get('tpu_spec')
-  preemptible_tpu = not args.get('nonpreemptible_tpu')
-  tpu_driver = args.get('tpu_driver')
-
   if tpu_spec is not None:
     available_tpu = cluster.get_tpu_types()
     if available_tpu is None:
@@ -433,7 +438,7 @@ def _job_submit(args: dict, cluster: Cluster) -> None:
     labels[um.TPU_ENABLED_TAG] = str(tpu_spec is not None)
     labels[um.DOCKER_IMAGE_TAG] = image_tag
 
-    experiments = create_experiments(
+    experiments = iter_experiments(
         session=session,
         container_spec=container_spec,
         script_args=script_args,
@@ -441,28 +446,31 @@ def _job_submit(args: dict, cluster: Cluster) -> None:
         xgroup=xgroup,
     )
 
-    specs = list(
-        cluster.create_simple_experiment_job_specs(
-            name=util.sanitize_job_name(job_name),
-            image=image_tag,
-            min_cpu=min_cpu,
-            min_mem=min_mem,
-            experiments=experiments,
-            args=script_args,
-            accelerator=accel,
-            accelerator_count=accel_count,
-            preemptible=preemptible,
-            preemptible_tpu=preemptible_tpu,
-            tpu_driver=tpu_driver,
-            labels=labels,
-            caliban_config=caliban_config,
-        ))
+    # experiments and job specs are generated lazily, so that submission
+    # starts before a large experiment config has been fully expanded
+    specs = cluster.create_simple_experiment_job_specs(
+        name=util.sanitize_job_name(job_name),
+        image=image_tag,
+        min_cpu=min_cpu,
+        min_mem=min_mem,
+        experiments=experiments,
+        args=script_args,
+        accelerator=accel,
+        accelerator_count=accel_count,
+        preemptible=preemptible,
+        preemptible_tpu=preemptible_tpu,
+        tpu_driver=tpu_driver,
+        labels=labels,
+        caliban_config=caliban_config,
+    )
 
     # just a dry run
     if dry_run:
-      logging.info('jobs that would be submitted:')
-      for s in specs:
-        logging.info(f'\n{json.dumps(s.spec, indent=2)}')
+      # rendering every spec is wasted work if it won't be shown
+      if logging.getLogger().isEnabledFor(logging.INFO):
+        logging.info('jobs that would be submitted:')
+        for s in specs:
+          logging.info('\n%s', json.dumps(s.spec, indent=2))
       return
 
     # export jobs to file
@@ -474,13 +482,18 @@ def _job_submit(args: dict, cluster: Cluster) -> None:
         print('error exporting jobs to {}'.format(export))
       return
 
-    for s in specs:
-      try:
-        cluster.submit_job(job_spec=s, name=job_name, labels=labels)
-      except Exception as e:
-        logging.error(f'exception: {e}')
-        session.commit()  # commit here, otherwise will be rolled back
-        return
+    jobs = cluster.submit_jobs(job_specs=specs,
+                               name=job_name,
+                               labels=labels,
+                               max_workers=submit_concurrency)
+
+    if jobs is None:
+      logging.error('error submitting jobs')
+      return
+
+    failed = sum(1 for j in jobs if j is None)
+    if failed > 0:
+      logging.error(f'{failed} of {len(jobs)} job submissions failed')
 
   # --------------------------------------------------------------------------
   logging.info(f'jobs submitted, visit {cluster.dashboard_url()} to monitor')
@@ -15,27 +15,20 @@
 # limitations under the License.
 """cluster abstraction for gcloud/gke"""
 
+import atexit
+import base64
+import functools
+import itertools
 import json
 import logging
-import re
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
-
-import googleapiclient
-import kubernetes
-import requests
-# silence warnings about ssl connection not being verified
-import urllib3
-import yaml
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timezone
+from typing import (TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator,
+                    List, Optional, Tuple)
+
 from google.auth.credentials import Credentials
-from google.cloud.container_v1 import ClusterManagerClient
-from google.cloud.container_v1.types import NodePool, Cluster as GKECluster
-from googleapiclient import discovery
-from googleapiclient.http import HttpRequest
-from kubernetes.client import (V1Container, V1DaemonSet, V1EnvVar, V1Job,
-                               V1JobSpec, V1ObjectMeta, V1Pod, V1PodSpec,
-                               V1PodTemplateSpec, V1ResourceRequirements,
-                               V1Toleration)
-from kubernetes.client.api_client import ApiClient
 
 import caliban.config.experiment as ce
 import caliban.platform.gke.constants as k
@@ -47,12 +40,117 @@ from caliban.platform.gke.types import NodeImage, OpStatus, ReleaseChannel
 from caliban.platform.gke.util import trap
 import caliban.util.metrics as um
 
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+# the container and kubernetes client libraries pull in grpc, protobuf and a
+# large amount of generated code, so we only import them at point of use to
+# keep cli startup fast
+if TYPE_CHECKING:
+  import kubernetes
+  from google.cloud.container_v1 import ClusterManagerClient
+  from google.cloud.container_v1.types import NodePool, Cluster as GKECluster
+  from googleapiclient import discovery
+  from googleapiclient.http import HttpRequest
+  from kubernetes.client import (V1DaemonSet, V1Job, V1ObjectMeta, V1Pod,
+                                 V1Toleration)
+  from kubernetes.client.api_client import ApiClient
 
 # ----------------------------------------------------------------------------
 # tone down logging from discovery
 logging.getLogger('googleapiclient.discovery').setLevel(logging.ERROR)
 
+# clients are expensive to construct (grpc channels, tls setup), so we
+# construct them once per process and share them between Cluster instances
+_CLUSTER_CLIENT_POOL: Dict[int, 'ClusterManagerClient'] = {}
+_KUBE_API_CLIENT_POOL: Dict[Tuple[str, str], 'ApiClient'] = {}
+
+# maps base64-encoded cluster ca certificates to the files they are written to
+_CA_CERT_FILES: Dict[str, str] = {}
+
+# container resource limit keys for each tpu type, keyed by (tpu, preemptible)
+_TPU_LIMIT_KEYS: Dict[Tuple[TPU, bool], str] = {
+    (tpu, preemptible): '{}/{}{}'.format(k.CONTAINER_RESOURCE_LIMIT_TPU,
+                                         'preemptible-' if preemptible else '',
+                                         tpu.name.lower()) for tpu in TPU
+    for preemptible in (True, False)
+}
+
+
+# ----------------------------------------------------------------------------
+def _cluster_client(creds: Credentials) -> 'ClusterManagerClient':
+  """gets the shared cluster management client for given credentials
+
+  Args:
+  creds: credentials
+
+  Returns:
+  ClusterManagerClient instance
+  """
+
+  client = _CLUSTER_CLIENT_POOL.get(id(creds))
+  if client is None:
+    from google.cloud.container_v1 import ClusterManagerClient
+    client = ClusterManagerClient(credentials=creds)
+    _CLUSTER_CLIENT_POOL[id(creds)] = client
+
+  return client
+
+
+# ----------------------------------------------------------------------------
+def _ca_cert_file(ca_cert: str) -> str:
+  """writes cluster ca certificate to a file for the kubernetes client
+
+  The kubernetes client only accepts a ca certificate as a file path, so we
+  write each certificate once per process and remove the file on exit.
+
+  Args:
+  ca_cert: base64-encoded pem certificate, as found in the cluster master_auth
+
+  Returns:
+  path to pem certificate file
+  """
+
+  path = _CA_CERT_FILES.get(ca_cert)
+  if path is None:
+    fd, path = tempfile.mkstemp(prefix='caliban-', suffix='.crt')
+    with os.fdopen(fd, 'wb') as f:
+      f.write(base64.b64decode(ca_cert))
+    atexit.register(os.remove, path)
+    _CA_CERT_FILES[ca_cert] = path
+
+  return path
+
+
+# ----------------------------------------------------------------------------
+def _kube_api_client(endpoint: str, token: str, ca_cert: str) -> 'ApiClient':
+  """gets the shared kubernetes api client for given endpoint and token
+
+  Args:
+  endpoint: cluster endpoint
+  token: bearer token
+  ca_cert: base64-encoded cluster ca certificate
+
+  Returns:
+  ApiClient instance
+  """
+
+  key = (endpoint, token)
+  client = _KUBE_API_CLIENT_POOL.get(key)
+  if client is None:
+    import kubernetes
+
+    cfg = kubernetes.client.Configuration()
+    cfg.host = 'https://{}:443'.format(endpoint)
+    cfg.verify_ssl = True
+    cfg.ssl_ca_cert = _ca_cert_file(ca_cert)
+    cfg.api_key = {'authorization': 'Bearer ' + token}
+    # this is sized for concurrent job submission (see Cluster.submit_jobs),
+    # as requests beyond the pool size open connections that are discarded
+    # after use
+    cfg.connection_pool_maxsize = k.KUBE_API_CONNECTION_POOL_SIZE
+    client = kubernetes.client.ApiClient(cfg)
+    _KUBE_API_CLIENT_POOL[key] = client
+
+  return client
+
 
 # ----------------------------------------------------------------------------
 def _parse_zone(zone: str) -> Optional[Tuple[str, str]]:
@@ -68,8 +166,7 @@ def _parse_zone(zone: str) -> Optional[Tuple[str, str]]:
   if zone is None:
     return None
 
-  zone_re = re.compile('^(?P<region>[a-z0-9]+-[a-z0-9]+)-(?P<zone>[a-z]+)$')
-  match = zone_re.match(zone)
+  match = k.ZONE_RE.match(zone)
   if match is None:
     return None
 
@@ -78,6 +175,149 @@ def _parse_zone(zone: str) -> Optional[Tuple[str, str]]:
   return (gd['region'], gd['zone'])
 
 
+# ----------------------------------------------------------------------------
+def _uncache_cluster(project_id: str, zone: str, name: str) -> None:
+  """removes on-disk cluster cache entries for given cluster
+
+  Args:
+  project_id: project id
+  zone: cluster zone
+  name: cluster name
+  """
+
+  for z in set([zone, k.ZONE_DEFAULT]):
+    util.write_cluster_cache(util.cluster_cache_key(project_id, z, name), None)
+
+
+# ----------------------------------------------------------------------------
+@functools.lru_cache(maxsize=128)
+def _container_limits(
+    accelerator: Optional[Accelerator], count: int,
+    preemptible_tpu: bool) -> Optional[Tuple[Tuple[str, int], ...]]:
+  """memoized implementation of Cluster.container_limits
+
+  Returns:
+  None for cpu, tuple of limit (key, value) pairs for gpu/tpu
+  """
+
+  if accelerator is None:  # cpu-only
+    return None
+
+  if type(accelerator) == GPU:
+    return ((k.CONTAINER_RESOURCE_LIMIT_GPU, count),)
+
+  # todo: should we validate tpu/count compatibility here, or should we
+  #       assume this is done upstream?
+  if type(accelerator) == TPU:
+    preemptible = preemptible_tpu and count == 8
+    return ((_TPU_LIMIT_KEYS[(accelerator, preemptible)], count),)
+
+  logging.error('error: invalid accelerator type: {}'.format(type(accelerator)))
+
+  return None
+
+
+# ----------------------------------------------------------------------------
+@functools.lru_cache(maxsize=128)
+def _node_selector(
+    preemptible: bool,
+    machine_type: Optional[MachineType],
+    accelerator: Optional[Accelerator],
+) -> Optional[Tuple[Tuple[str, str], ...]]:
+  """memoized implementation of Cluster.node_selector
+
+  Returns:
+  tuple of selector (key, value) pairs, None if no selector is needed
+  """
+
+  selector = []
+
+  if preemptible:
+    selector.append((k.NODE_SELECTOR_PREEMPTIBLE, 'true'))
+
+  if machine_type is not None:
+    selector.append((k.NODE_SELECTOR_INSTANCE_TYPE, machine_type.value))
+
+  # see: https://cloud.google.com/kubernetes-engine/docs/how-to/gpus
+  if isinstance(accelerator, GPU):
+    selector.append((k.NODE_SELECTOR_GKE_ACCELERATOR,
+                     accelerator.value.lower().replace('_', '-')))
+
+  if len(selector) == 0:
+    return None
+
+  return tuple(selector)
+
+
+# ----------------------------------------------------------------------------
+@functools.lru_cache(maxsize=None)
+def _preemptible_toleration() -> 'V1Toleration':
+  """shared toleration for preemptible vm instances, must not be modified"""
+
+  from kubernetes.client import V1Toleration
+
+  return V1Toleration(key=k.NODE_SELECTOR_PREEMPTIBLE,
+                      operator='Equal',
+                      value='true',
+                      effect='NoSchedule')
+
+
+# ----------------------------------------------------------------------------
+@functools.lru_cache(maxsize=16)
+def _tpu_template_metadata(tpu_driver: str) -> 'V1ObjectMeta':
+  """shared tpu pod template metadata, must not be modified"""
+
+  from kubernetes.client import V1ObjectMeta
+
+  return V1ObjectMeta(
+      annotations={k.TEMPLATE_META_ANNOTATION_TPU_DRIVER: tpu_driver})
+
+
+# ----------------------------------------------------------------------------
+def _list_pages(list_fn: Callable, **kwargs) -> Iterator[Any]:
+  """iterates over the items returned by a paged kubernetes list call
+
+  Pages are fetched as they are consumed, so only one page is held at a time.
+
+  Args:
+  list_fn: kubernetes api list function, e.g. list_job_for_all_namespaces
+  kwargs: additional arguments for list_fn
+
+  Returns:
+  iterator over listed items
+  """
+
+  token = None
+  while True:
+    rsp = list_fn(watch=False,
+                  limit=k.KUBE_LIST_PAGE_SIZE,
+                  _continue=token,
+                  **kwargs)
+    yield from rsp.items
+
+    token = rsp.metadata._continue
+    if not token:
+      return
+
+
+# ----------------------------------------------------------------------------
+def _logged_iter(items: Iterator[Any], msg: str) -> Iterator[Any]:
+  """iterates over items, logging and stopping on error
+
+  Args:
+  items: iterator
+  msg: message logged on error
+
+  Returns:
+  iterator over items
+  """
+
+  try:
+    yield from items
+  except Exception as e:
+    logging.exception('{}: {}'.format(msg, e))
+
+
 # ----------------------------------------------------------------------------
 def connected(error_value: Any) -> Any:
   """decorator for Cluster that checks connection status
@@ -187,14 +427,30 @@ class Cluster(object):
   cluster tasks.
   """
 
+  __slots__ = (
+      '_cluster_client',
+      '_endpoint',
+      '_ca_cert',
+      '_core_api',
+      '_batch_api',
+      '_apps_api',
+      '_tpu_api',
+      'name',
+      'project_id',
+      'zone',
+      'credentials',
+      'connected',
+  )
+
   # --------------------------------------------------------------------------
   def __init__(self, name: Optional[str], project_id: str, zone: str,
                credentials: Credentials):
     self._cluster_client = None
-    self._gke_cluster: Optional[GKECluster] = None
-    self._core_api: Optional[kubernetes.client.CoreV1Api] = None
-    self._batch_api: Optional[kubernetes.client.BatchV1Api] = None
-    self._apps_api: Optional[kubernetes.client.AppsV1Api] = None
+    self._endpoint: Optional[str] = None
+    self._ca_cert: Optional[str] = None
+    self._core_api: Optional['kubernetes.client.CoreV1Api'] = None
+    self._batch_api: Optional['kubernetes.client.BatchV1Api'] = None
+    self._apps_api: Optional['kubernetes.client.AppsV1Api'] = None
     self._tpu_api = None
     self.name = name
     self.project_id = project_id
@@ -214,61 +470,72 @@ class Cluster(object):
 
     self.connected = False
 
-    # if gke cluster info already populated, then noop
-    # otherwise uses cluster api to get cluster info
+    # if cluster connection info already populated, then noop
+    # otherwise uses the cluster cache or cluster api to get it
     if not self._set_gke_cluster():
       return False
 
-    if self._gke_cluster is None:
+    if self._endpoint is None:
       return False
 
-    # resolve our zone in case the wildcard '-' was passed
-    self.zone = self._gke_cluster.zone
-
-    # set our name in case None was passed
-    self.name = self._gke_cluster.name
+    import kubernetes
 
     # ok, now we set up the kubernetes api using our cluster info and
     # credentials
-    cfg = kubernetes.client.Configuration()
-    cfg.host = 'https://{}:443'.format(self._gke_cluster.endpoint)
-    cfg.verify_ssl = False  #True #todo: figure out how to do this properly
-    #cfg.ssl_ca_cert = c.master_auth.cluster_ca_certificate
-    cfg.api_key = {'authorization': 'Bearer ' + self.credentials.token}
-
-    api_client = kubernetes.client.ApiClient(cfg)
+    api_client = _kube_api_client(self._endpoint, self.credentials.token,
+                                  self._ca_cert)
 
     self._core_api = kubernetes.client.CoreV1Api(api_client)
     self._batch_api = kubernetes.client.BatchV1Api(api_client)
     self._apps_api = kubernetes.client.AppsV1Api(api_client)
 
-    self._tpu_api = googleapiclient.discovery.build(
-        'tpu', 'v1', credentials=self.credentials, cache_discovery=False)
+    self._tpu_api = util.build_api('tpu', 'v1', self.credentials)
 
     # using this as a connection test
     # todo: is there a better way to verify connectivity?
-    self.connected = (self._core_api.get_api_resources(async_req=False) is
-                      not None)
+    try:
+      self.connected = (self._core_api.get_api_resources(async_req=False) is
+                        not None)
+    finally:
+      # cached connection info may be stale, e.g. if the cluster was
+      # recreated outside of caliban
+      if not self.connected:
+        _uncache_cluster(self.project_id, self.zone, self.name)
 
     return self.connected
 
   # --------------------------------------------------------------------------
   def _set_gke_cluster(self) -> bool:
-    """sets the gke cluster for this instance
+    """sets the cluster connection info (endpoint, ca certificate, zone and
+    name) for this instance
+
+    Only the connection info is cached on disk, anything else about the
+    cluster (e.g. node pools) is always fetched from the cluster api.
 
     Returns:
     True on success, False otherwise
     """
 
-    if self._gke_cluster is not None:
+    if self._endpoint is not None:
       return True
 
-    self._cluster_client = ClusterManagerClient(credentials=self.credentials)
+    self._cluster_client = _cluster_client(self.credentials)
 
     if self._cluster_client is None:
       logging.error('error getting cluster management client')
       return False
 
+    # try the on-disk cluster cache first to avoid a gke api round-trip
+    cache_key = None
+    if self.name is not None:
+      cache_key = util.cluster_cache_key(self.project_id, self.zone, self.name)
+      cached = util.read_cluster_cache(cache_key)
+      if cached is not None:
+        self.zone = cached['zone']
+        self._endpoint = cached['endpoint']
+        self._ca_cert = cached['cluster_ca_certificate']
+        return True
+
     cluster_list = util.get_gke_clusters(self._cluster_client, self.project_id,
                                          self.zone)
     if cluster_list is None:
@@ -283,18 +550,48 @@ class Cluster(object):
       return False
 
     if self.name is None:
-      self._gke_cluster = cluster_list[0]
+      self._set_connection_info(cluster_list[0])
       return True
 
-    cluster_dict = dict([(c.name, c) for c in cluster_list])
-    if self.name not in cluster_dict:
+    cluster = next((c for c in cluster_list if c.name == self.name), None)
+    if cluster is None:
       logging.error('cluster {} not found'.format(self.name))
       return False
 
-    self._gke_cluster = cluster_dict[self.name]
+    self._set_connection_info(cluster)
+
+    # cached info expires along with the credentials used to get it
+    expiry = self.credentials.expiry
+    if expiry is not None:
+      util.write_cluster_cache(
+          cache_key,
+          {
+              'zone': self.zone,
+              'endpoint': self._endpoint,
+              'cluster_ca_certificate': self._ca_cert,
+          },
+          expiry.replace(tzinfo=timezone.utc).timestamp(),
+      )
 
     return True
 
+  # --------------------------------------------------------------------------
+  def _set_connection_info(self, cluster: 'GKECluster') -> None:
+    """sets the connection info for this instance from a gke cluster
+
+    Args:
+    cluster: gke cluster
+    """
+
+    # resolve our zone in case the wildcard '-' was passed
+    self.zone = cluster.zone
+
+    # set our name in case None was passed
+    self.name = cluster.name
+
+    self._endpoint = cluster.endpoint
+    self._ca_cert = cluster.master_auth.cluster_ca_certificate
+
   # --------------------------------------------------------------------------
   @staticmethod
   def list(project_id: str,
@@ -311,7 +608,7 @@ class Cluster(object):
     list of cluster names on success, None otherwise
     """
 
-    client = ClusterManagerClient(credentials=creds)
+    client = _cluster_client(creds)
 
     if client is None:
       logging.error('error getting cluster management client')
@@ -364,28 +661,8 @@ class Cluster(object):
     None for cpu, limits dictionary for gpu/tpu
     """
 
-    if accelerator is None:  # cpu-only
-      return None
-
-    if type(accelerator) == GPU:
-      return {k.CONTAINER_RESOURCE_LIMIT_GPU: count}
-
-    # todo: should we validate tpu/count compatibility here, or should we
-    #       assume this is done upstream?
-    if type(accelerator) == TPU:
-      return {
-          '/'.join([
-              k.CONTAINER_RESOURCE_LIMIT_TPU,
-              ('preemptible-' if (preemptible_tpu and count == 8) else '') + accelerator.name.lower(
-              )
-          ]):
-              count
-      }
-
-    logging.error('error: invalid accelerator type: {}'.format(
-        type(accelerator)))
-
-    return None
+    limits = _container_limits(accelerator, count, preemptible_tpu)
+    return dict(limits) if limits is not None else None
 
   # --------------------------------------------------------------------------
   @staticmethod
@@ -409,7 +686,7 @@ class Cluster(object):
   @staticmethod
   def template_metadata(
       accelerator: Optional[Accelerator] = None,
-      tpu_driver: str = k.DEFAULT_TPU_DRIVER) -> Optional[V1ObjectMeta]:
+      tpu_driver: str = k.DEFAULT_TPU_DRIVER) -> Optional['V1ObjectMeta']:
     """generates template metadata for given accelerator type
 
     Args:
@@ -417,12 +694,12 @@ class Cluster(object):
     tpu_driver: tpu driver to use
 
     Returns:
-    template metadata necessary for given accelerator
+    template metadata necessary for given accelerator, this is shared between
+    calls and must not be modified
     """
 
     if type(accelerator) == TPU:
-      return V1ObjectMeta(
-          annotations={k.TEMPLATE_META_ANNOTATION_TPU_DRIVER: tpu_driver})
+      return _tpu_template_metadata(tpu_driver)
 
     return None
 
@@ -443,89 +720,83 @@ class Cluster(object):
     node selector dictionary for given criteria
     """
 
-    selector = {}
-
-    if preemptible:
-      selector[k.NODE_SELECTOR_PREEMPTIBLE] = 'true'
-
-    if machine_type is not None:
-      selector[k.NODE_SELECTOR_INSTANCE_TYPE] = machine_type.value
-
-    # see: https://cloud.google.com/kubernetes-engine/docs/how-to/gpus
-    if isinstance(accelerator, GPU):
-      selector[
-          k.NODE_SELECTOR_GKE_ACCELERATOR] = accelerator.value.lower().replace(
-              '_', '-')
-
-    if len(selector) == 0:
-      return None
-
-    return selector
+    selector = _node_selector(preemptible, machine_type, accelerator)
+    return dict(selector) if selector is not None else None
 
   # --------------------------------------------------------------------------
   @staticmethod
-  def tolerations(preemptible: bool = True) -> Optional[List[V1Toleration]]:
+  def tolerations(preemptible: bool = True) -> Optional[List['V1Toleration']]:
     """creates tolerations for pod spec
 
     Args:
     preemptible: tolerate preemptible vm instances
 
     Returns:
-    list of tolerations
+    list of tolerations, the tolerations themselves are shared between calls
+    and must not be modified
     """
 
     if not preemptible:
       return []
 
-    return [
-        V1Toleration(key=k.NODE_SELECTOR_PREEMPTIBLE,
-                     operator='Equal',
-                     value='true',
-                     effect='NoSchedule')
-    ]
+    return [_preemptible_toleration()]
 
   # --------------------------------------------------------------------------
-  @trap(None)
   @connected(None)
-  def pods(self) -> Optional[List[V1Pod]]:
-    """gets a list of pods for this cluster
+  def iter_pods(
+      self,
+      label_selector: Optional[str] = None) -> Optional[Iterator['V1Pod']]:
+    """iterates over the pods for this cluster, fetching them page by page
+
+    Note that this filters out the pods in the kube-system namespace. Errors
+    while iterating are logged, and end the iteration.
 
-    Note that this filters out the pods in the kube-system namespace
+    Args:
+    label_selector: optional kubernetes label selector, e.g. 'app=x,env!=y'
 
     Returns:
-    list of V1Pod instances on success, None otherwise
+    iterator over V1Pod instances on success, None otherwise
     """
 
     if self._core_api is None:
       return None
 
-    # this returns a V1PodList
-    rsp = self._core_api.list_pod_for_all_namespaces(watch=False)
+    return _logged_iter(self._list_pods(label_selector), 'error listing pods')
 
-    cluster_pods = [
-        p for p in rsp.items if p.metadata.namespace != k.KUBE_SYSTEM_NAMESPACE
-    ]
-
-    return cluster_pods
+  # --------------------------------------------------------------------------
+  def _list_pods(self, label_selector: Optional[str]) -> Iterator['V1Pod']:
+    """iterates over non-system pods, all filters are applied server-side"""
+    return _list_pages(self._core_api.list_pod_for_all_namespaces,
+                       field_selector='metadata.namespace!={}'.format(
+                           k.KUBE_SYSTEM_NAMESPACE),
+                       label_selector=label_selector)
 
   # --------------------------------------------------------------------------
-  @trap(None)
   @connected(None)
-  def jobs(self) -> Optional[List[V1Job]]:
-    """gets a list of jobs for this cluster
+  def iter_jobs(
+      self,
+      label_selector: Optional[str] = None) -> Optional[Iterator['V1Job']]:
+    """iterates over the jobs for this cluster, fetching them page by page
+
+    Errors while iterating are logged, and end the iteration.
+
+    Args:
+    label_selector: optional kubernetes label selector, e.g. 'app=x,env!=y'
 
     Returns:
-    list of V1Job instances on success, None otherwise
+    iterator over V1Job instances on success, None otherwise
     """
     if self._batch_api is None:
       return None
 
-    return self._batch_api.list_job_for_all_namespaces(watch=False).items
+    return _logged_iter(
+        _list_pages(self._batch_api.list_job_for_all_namespaces,
+                    label_selector=label_selector), 'error listing jobs')
 
   # --------------------------------------------------------------------------
   @trap(None)
   @connected(None)
-  def get_job(self, job_name: str) -> Optional[V1Job]:
+  def get_job(self, job_name: str) -> Optional['V1Job']:
     '''gets a v1job from the cluster from the given job name'''
     if self._batch_api is None:
       return None
@@ -576,26 +847,30 @@ class Cluster(object):
 
   # --------------------------------------------------------------------------
   @connected(None)
-  def node_pools(self) -> Optional[List[NodePool]]:
+  def node_pools(self) -> Optional[List['NodePool']]:
     """gets a list of node pools for this cluster
 
     Returns:
     list of node pools on success, None otherwise
     """
 
-    if self._gke_cluster is None:
+    # node pools may change at any time, so they are not taken from the
+    # cached cluster connection info
+    cluster = util.get_gke_cluster(self._cluster_client, self.name,
+                                   self.project_id, self.zone)
+    if cluster is None:
       return None
 
-    return self._gke_cluster.node_pools
+    return cluster.node_pools
 
   # --------------------------------------------------------------------------
   @trap(None, silent=False)
   @connected(None)
   def submit_v1job(
       self,
-      job: V1Job,
+      job: 'V1Job',
       namespace: str = k.DEFAULT_NAMESPACE,
-  ) -> Optional[V1Job]:
+  ) -> Optional['V1Job']:
     """submits kubernetes job to cluster
 
     Args:
@@ -609,10 +884,12 @@ class Cluster(object):
     if self._batch_api is None:
       return None
 
-    return self._batch_api.create_namespaced_job(namespace=namespace,
-                                                 body=job,
-                                                 async_req=False,
-                                                 pretty=True)
+    return self._batch_api.create_namespaced_job(
+        namespace=namespace,
+        body=job,
+        async_req=False,
+        pretty=True,
+        _request_timeout=k.KUBE_API_REQUEST_TIMEOUT_SEC)
 
   # --------------------------------------------------------------------------
   @classmethod
@@ -621,9 +898,11 @@ class Cluster(object):
       job_spec: JobSpec,
       name: str,
       labels: Optional[Dict[str, str]] = None,
-  ) -> V1Job:
+  ) -> 'V1Job':
     '''creates a V1Job from a JobSpec, a job name, and an optional set of labels'''
 
+    from kubernetes.client import V1Job, V1ObjectMeta
+
     name = util.sanitize_job_name(name)
 
     # todo: sanitize labels
@@ -641,7 +920,7 @@ class Cluster(object):
       job_specs: Iterable[JobSpec],
       name: str,
       labels: Optional[Dict[str, str]] = None,
-  ) -> List[V1Job]:
+  ) -> List['V1Job']:
     '''create a list of V1Jobs from a list of JobSpecs'''
     return [
         cls.create_v1job(job_spec=s, name=name, labels=labels)
@@ -660,25 +939,86 @@ class Cluster(object):
     '''submits a job to the cluster based on the given job spec'''
 
     v1job = self.create_v1job(job_spec=job_spec, name=name, labels=labels)
-    submitted = self.submit_v1job(v1job)
-    container = job_spec.spec['template']['spec']['containers'][0]['image']
+    return self._submitted_job(job_spec, self.submit_v1job(v1job))
 
-    if submitted is not None:
-      details = {
-          'cluster_name': self.name,
-          'project_id': self.project_id,
-          'cluster_zone': self.zone,
-          'job': ApiClient().sanitize_for_serialization(submitted),
-      }
-
-      return Job(
-          spec=job_spec,
-          container=container,
-          details=details,
-          status=JobStatus.SUBMITTED,
-      )
+  # --------------------------------------------------------------------------
+  @trap(None, silent=False)
+  @connected(None)
+  def submit_jobs(
+      self,
+      job_specs: Iterable[JobSpec],
+      name: str,
+      labels: Optional[Dict[str, str]] = None,
+      max_workers: int = k.JOB_SUBMIT_MAX_WORKERS,
+  ) -> Optional[List[Optional[Job]]]:
+    """submits jobs to the cluster concurrently
 
-    return None
+    Only the kubernetes api calls are made from worker threads, the Job
+    records are created in the calling thread as they are added to the
+    (non thread-safe) database session. Job specs are consumed in batches of
+    2 * max_workers, so a lazily-generated set of specs starts submitting
+    before it has been fully generated.
+
+    Args:
+    job_specs: job specs
+    name: job name
+    labels: optional job labels
+    max_workers: maximum number of concurrent submissions
+
+    Returns:
+    list of Job (or None for each failed submission) on success,
+    None otherwise
+    """
+
+    jobs = []
+    job_specs = iter(job_specs)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+      while True:
+        batch = list(itertools.islice(job_specs, 2 * max_workers))
+        if len(batch) == 0:
+          break
+
+        v1jobs = [
+            self.create_v1job(job_spec=s, name=name, labels=labels)
+            for s in batch
+        ]
+
+        submitted = executor.map(self.submit_v1job, v1jobs)
+        jobs.extend(self._submitted_job(s, j) for s, j in zip(batch, submitted))
+
+    return jobs
+
+  # --------------------------------------------------------------------------
+  def _submitted_job(self, job_spec: JobSpec,
+                     submitted: Optional['V1Job']) -> Optional[Job]:
+    """creates a Job record for a submitted job
+
+    Args:
+    job_spec: job spec
+    submitted: submitted job, None if submission failed
+
+    Returns:
+    Job on success, None if submission failed
+    """
+
+    if submitted is None:
+      return None
+
+    container = job_spec.spec['template']['spec']['containers'][0]['image']
+    details = {
+        'cluster_name': self.name,
+        'project_id': self.project_id,
+        'cluster_zone': self.zone,
+        'job': util.job_to_dict(submitted),
+    }
+
+    return Job(
+        spec=job_spec,
+        container=container,
+        details=details,
+        status=JobStatus.SUBMITTED,
+    )
 
   # --------------------------------------------------------------------------
   @connected(None)
@@ -747,6 +1087,9 @@ class Cluster(object):
     # ------------------------------------------------------------------------
     # container
 
+    from kubernetes.client import (V1Container, V1EnvVar, V1JobSpec, V1PodSpec,
+                                   V1PodTemplateSpec, V1ResourceRequirements)
+
     # tpu/gpu resources
     container_resources = V1ResourceRequirements(
         requests=Cluster.container_requests(min_cpu, min_mem),
@@ -807,7 +1150,7 @@ class Cluster(object):
 
     return JobSpec.get_or_create(
         experiment=experiment,
-        spec=ApiClient().sanitize_for_serialization(job_spec),
+        spec=util.k8s_serializer().sanitize_for_serialization(job_spec),
         platform=Platform.GKE,
     )
 
@@ -856,33 +1199,34 @@ class Cluster(object):
     caliban_config: caliban config dict
 
     Returns:
-    JobSpec iterable on success, None otherwise
+    JobSpec iterable on success, None otherwise, the job specs are generated
+    as the iterable is consumed
     """
 
-    job_specs = []
-    for index, exp in enumerate(list(experiments)):
-      job_specs.append(
-          self.create_simple_job_spec(
-              experiment=exp,
-              name=name,
-              image=image,
-              min_cpu=min_cpu,
-              min_mem=min_mem,
-              index=index,
-              command=command,
-              env=env,
-              accelerator=accelerator,
-              accelerator_count=accelerator_count,
-              namespace=namespace,
-              machine_type=machine_type,
-              preemptible=preemptible,
-              preemptible_tpu=preemptible_tpu,
-              tpu_driver=tpu_driver,
-              labels=labels,
-              caliban_config=caliban_config,
-          ))
-
-    return job_specs
+    # these are shared by every job spec, create_simple_job_spec does not
+    # modify them
+    base_kwargs = dict(
+        name=name,
+        image=image,
+        min_cpu=min_cpu,
+        min_mem=min_mem,
+        command=command,
+        env=env,
+        accelerator=accelerator,
+        accelerator_count=accelerator_count,
+        namespace=namespace,
+        machine_type=machine_type,
+        preemptible=preemptible,
+        preemptible_tpu=preemptible_tpu,
+        tpu_driver=tpu_driver,
+        labels=labels or {},
+        caliban_config=caliban_config or {},
+    )
+
+    return (self.create_simple_job_spec(experiment=exp,
+                                        index=index,
+                                        **base_kwargs)
+            for index, exp in enumerate(experiments))
 
   # --------------------------------------------------------------------------
   @staticmethod
@@ -924,7 +1268,7 @@ class Cluster(object):
 
   # --------------------------------------------------------------------------
   @connected(None)
-  def job_dashboard_url(self, job: V1Job) -> Optional[str]:
+  def job_dashboard_url(self, job: 'V1Job') -> Optional[str]:
     """returns dashboard url for given job
 
     Args:
@@ -961,14 +1305,11 @@ class Cluster(object):
     list of supported gpu types on success, None otherwise
     """
 
-    container_api = googleapiclient.discovery.build(
-        'container', 'v1', credentials=self.credentials, cache_discovery=False)
-
-    # for some reason, autoprovisioning data is not in the _gke_cluster
+    # for some reason, autoprovisioning data is not in the gke cluster
     # instance, so we query using the container api here
-    rsp = container_api.projects().locations().clusters().get(
-        name='projects/{}/locations/{}/clusters/{}'.format(
-            self.project_id, self.zone, self.name)).execute()
+    container_api = util.build_api('container', 'v1', self.credentials)
+    rsp = util.get_cluster_details(container_api, self.project_id, self.zone,
+                                   self.name)
 
     if rsp is None:
       logging.error('error getting cluster info')
@@ -985,11 +1326,10 @@ class Cluster(object):
 
     limits = rsp['autoscaling']['resourceLimits']
 
-    gpu_re = re.compile('^nvidia-tesla-(?P<type>[a-z0-9]+)$')
     gpus = []
 
     for x in limits:
-      match = gpu_re.match(x['resourceType'])
+      match = k.GPU_RE.match(x['resourceType'])
       if match is None:
         continue
       gd = match.groupdict()
@@ -998,6 +1338,7 @@ class Cluster(object):
     return gpus
 
   # --------------------------------------------------------------------------
+  @connected(False)
   def validate_gpu_spec(self, gpu_spec: Optional[GPUSpec]) -> bool:
     """validates gpu spec against zone and cluster contraints
 
@@ -1012,17 +1353,13 @@ class Cluster(object):
 
     # ------------------------------------------------------------------------
     # validate against zone instance limits
-    compute_api = googleapiclient.discovery.build('compute',
-                                                  'v1',
-                                                  credentials=self.credentials,
-                                                  cache_discovery=False)
-
+    compute_api = util.build_api('compute', 'v1', self.credentials)
     zone_gpus = util.get_zone_gpu_types(compute_api, self.project_id, self.zone)
 
     if zone_gpus is None:
       return False
 
-    gpu_limits = dict([(x.gpu, x.count) for x in zone_gpus])
+    gpu_limits = {x.gpu: x.count for x in zone_gpus}
     if not util.validate_gpu_spec_against_limits(gpu_spec, gpu_limits, 'zone'):
       return False
 
@@ -1032,7 +1369,7 @@ class Cluster(object):
     if available_gpu is None:
       return False
 
-    gpu_limits = dict([(x.gpu, x.count) for x in available_gpu])
+    gpu_limits = {x.gpu: x.count for x in available_gpu}
     if not util.validate_gpu_spec_against_limits(gpu_spec, gpu_limits,
                                                  'cluster'):
       return False
@@ -1044,8 +1381,8 @@ class Cluster(object):
   @connected(None)
   def apply_daemonset(
       self,
-      daemonset: V1DaemonSet,
-      namespace: str = k.DEFAULT_NAMESPACE) -> Optional[V1DaemonSet]:
+      daemonset: 'V1DaemonSet',
+      namespace: str = k.DEFAULT_NAMESPACE) -> Optional['V1DaemonSet']:
     """applies daemonset to cluster
 
     Args:
@@ -1067,7 +1404,8 @@ class Cluster(object):
   # --------------------------------------------------------------------------
   @connected(None)
   def apply_daemonset_from_url(
-      self, url: str, parser: Callable[[bytes], dict]) -> Optional[V1DaemonSet]:
+      self, url: str, parser: Callable[[bytes],
+                                       dict]) -> Optional['V1DaemonSet']:
     """applies daemonset to cluster from file url
 
     Args:
@@ -1078,12 +1416,12 @@ class Cluster(object):
     V1DaemonSet on success, None otherwise
     """
 
-    response = requests.get(url)
-    if response.status_code != requests.codes.ok:
-      print('error getting data from {}'.format(url))
+    data = util.fetch_url(url)
+    if data is None:
+      logging.error('error fetching daemonset from {}'.format(url))
       return None
 
-    body = parser(response.content)
+    body = parser(data)
 
     namespace = k.DEFAULT_NAMESPACE
     if 'metadata' in body:
@@ -1107,6 +1445,8 @@ class Cluster(object):
     op = self._cluster_client.delete_cluster(project_id=self.project_id,
                                              zone=self.zone,
                                              cluster_id=self.name)
+    util.invalidate_api_cache()
+    _uncache_cluster(self.project_id, self.zone, self.name)
 
     print('deleting cluster {}...'.format(self.name))
     print('visit {} to monitor deletion progress'.format(self.dashboard_url()))
@@ -1145,10 +1485,10 @@ class Cluster(object):
   # ----------------------------------------------------------------------------
   @staticmethod
   @trap(None, silent=False)
-  def create_request(cluster_api: discovery.Resource, creds: Credentials,
+  def create_request(cluster_api: 'discovery.Resource', creds: Credentials,
                      cluster_name: str, project_id: str, zone: str,
                      release_channel: ReleaseChannel,
-                     single_zone: bool) -> Optional[HttpRequest]:
+                     single_zone: bool) -> Optional['HttpRequest']:
     '''generates cluster create request
 
     Args:
@@ -1181,10 +1521,7 @@ class Cluster(object):
 
     region, _ = rz
 
-    compute_api = discovery.build('compute',
-                                  'v1',
-                                  credentials=creds,
-                                  cache_discovery=False)
+    compute_api = util.build_api('compute', 'v1', creds)
 
     resource_limits = util.generate_resource_limits(compute_api, project_id,
                                                     region)
@@ -1214,8 +1551,8 @@ class Cluster(object):
   # ----------------------------------------------------------------------------
   @staticmethod
   @trap(None, silent=False)
-  def create(cluster_api: discovery.Resource, creds: Credentials,
-             request: HttpRequest, project_id: str) -> "Optional[Cluster]":
+  def create(cluster_api: 'discovery.Resource', creds: Credentials,
+             request: 'HttpRequest', project_id: str) -> "Optional[Cluster]":
     '''create cluster
 
     Note that this is a blocking call.
@@ -1243,6 +1580,9 @@ class Cluster(object):
       logging.error('error: could not create cluster')
       return None
 
+    util.invalidate_api_cache()
+    _uncache_cluster(project_id, zone, cluster_name)
+
     # wait for creation operation to complete
     operation_name = rsp['name']
     rsp = util.wait_for_operation(
@@ -1270,7 +1610,6 @@ class Cluster(object):
     logging.info('created cluster {} successfully'.format(cluster_name))
     logging.info('applying nvidia driver daemonset...')
 
-    rsp = cluster.apply_daemonset_from_url(
-        daemonset_url, lambda x: yaml.load(x, Loader=yaml.FullLoader))
+    rsp = cluster.apply_daemonset_from_url(daemonset_url, util.parse_yaml)
 
     return cluster
@@ -47,6 +47,19 @@ DEFAULT_CLUSTER_NAME = 'blueshift'
 VALID_JOB_FILE_EXT = ('.yaml', '.json')
 DEFAULT_RELEASE_CHANNEL = ReleaseChannel.REGULAR
 CLUSTER_API_VERSION = 'v1beta1'
+API_CACHE_TTL_SEC = 60
+OPERATION_MAX_POLL_SEC = 30
+# maximum number of connections kept open to a cluster's kubernetes api
+KUBE_API_CONNECTION_POOL_SIZE = 64
+KUBE_LIST_PAGE_SIZE = 500
+KUBE_API_REQUEST_TIMEOUT_SEC = 60
+JOB_SUBMIT_MAX_WORKERS = 16
+CLUSTER_CACHE_FILE = '~/.caliban/cluster_cache.json'
+# minimum remaining lifetime (in seconds) for a cluster cache entry to be used
+CLUSTER_CACHE_MIN_TTL_SEC = 30
+URL_CACHE_DIR = '~/.caliban/cache'
+URL_FETCH_TIMEOUT_SEC = 30
+URL_FETCH_RETRIES = 3
 
 # default min_cpu for gpu/tpu -accelerated jobs (in milli-cpu)
 DEFAULT_MIN_CPU_ACCEL = 1500
@@ -72,3 +85,8 @@ NVIDIA_DRIVER_UBUNTU_DAEMONSET_URL = 'https://raw.githubusercontent.com/GoogleCl
 
 # ----------------------------------------------------------------------------
 DNS_1123_RE = re.compile('\A[a-z0-9]([a-z0-9\-\.]*[a-z0-9])?\Z')
+ZONE_RE = re.compile('^(?P<region>[a-z0-9]+-[a-z0-9]+)-(?P<zone>[a-z]+)$')
+TPU_RE = re.compile('^(?P<tpu>(v2|v3))-(?P<count>[0-9]+)$')
+GPU_RE = re.compile('^nvidia-tesla-(?P<type>[a-z0-9]+)$')
+GPU_QUOTA_PREFIX = 'NVIDIA_'
+GPU_QUOTA_SUFFIX = '_GPUS'
@@ -16,10 +16,12 @@
 """types relevant to gke"""
 
 from enum import Enum
-from typing import NamedTuple, Optional
+from typing import TYPE_CHECKING, NamedTuple, Optional
 
 from google.auth.credentials import Credentials
-from kubernetes.client import V1Job
+
+if TYPE_CHECKING:
+  from kubernetes.client import V1Job
 
 # ----------------------------------------------------------------------------
 # Node image types
@@ -78,7 +80,7 @@ class JobStatus(Enum):
     return self.name in ['FAILED', 'SUCCEEDED', 'UNAVAILABLE']
 
   @classmethod
-  def from_job_info(cls, job_info: V1Job) -> "JobStatus":
+  def from_job_info(cls, job_info: 'V1Job') -> "JobStatus":
     if job_info is None:
       return JobStatus.STATE_UNSPECIFIED
 
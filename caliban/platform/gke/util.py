@@ -18,26 +18,30 @@
 from __future__ import absolute_import
 
 import argparse
+import fcntl
+import functools
+import hashlib
 import json
 import logging
 import os
-import pprint as pp
-import re
-from time import sleep
-from typing import Any, Dict, List, Optional
+import random
+import string
+import threading
+from pprint import pformat
+from time import monotonic, sleep, time
+from typing import (TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple)
 from urllib.parse import urlencode, urlparse
 
 import google
+import google_auth_httplib2
 import yaml
 from google.auth._cloud_sdk import get_application_default_credentials_path
 from google.auth._default import (_AUTHORIZED_USER_TYPE, _SERVICE_ACCOUNT_TYPE,
                                   load_credentials_from_file)
-from google.cloud.container_v1 import ClusterManagerClient
-from google.cloud.container_v1.types import Cluster as GKECluster
+from google.auth.credentials import Credentials
 from google.oauth2 import service_account
 from googleapiclient import discovery
-from kubernetes.client import V1Job
-from kubernetes.client.api_client import ApiClient
+from googleapiclient.http import build_http
 from yaspin import yaspin
 from yaspin.spinners import Spinners
 
@@ -45,6 +49,39 @@ import caliban.platform.gke.constants as k
 from caliban.platform.cloud.types import GPU, TPU, GPUSpec, TPUSpec
 from caliban.platform.gke.types import CredentialsData, NodeImage, OpStatus
 
+# the libyaml-backed loader is much faster than the pure-python one, but is
+# only available if pyyaml was built against libyaml
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# the container and kubernetes client libraries are slow to import, so they
+# are only imported for type checking here and imported at point of use
+if TYPE_CHECKING:
+  from google.cloud.container_v1 import ClusterManagerClient
+  from google.cloud.container_v1.types import Cluster as GKECluster
+  from kubernetes.client import V1Job
+  from kubernetes.client.api_client import ApiClient
+
+# cache for gcp api responses, maps (function name, id(api), args) to a
+# (timestamp, api, response) tuple, see ttl_cache below
+_API_CACHE: Dict[Tuple, Tuple[float, Any, Any]] = {}
+
+# discovery api clients, maps (name, version, id(creds), thread id) to a
+# (creds, client) tuple, see build_api below
+_API_CLIENTS: Dict[Tuple[str, str, int, int], Tuple[Credentials, Any]] = {}
+
+
+# ----------------------------------------------------------------------------
+class _DashTranslation(dict):
+  """str.translate table that maps every character not in the table to '-'"""
+
+  def __missing__(self, key):
+    return '-'
+
+
+_DNS_1123_ALNUM = frozenset(string.ascii_lowercase + string.digits)
+_DNS_1123_TRANSLATION = _DashTranslation(
+    (ord(c), c) for c in _DNS_1123_ALNUM.union('-.'))
+
 
 # ----------------------------------------------------------------------------
 def trap(error_value: Any, silent: bool = True) -> Any:
@@ -74,6 +111,51 @@ def trap(error_value: Any, silent: bool = True) -> Any:
   return check
 
 
+# ----------------------------------------------------------------------------
+def ttl_cache(ttl: float = k.API_CACHE_TTL_SEC) -> Callable:
+  """decorator that caches gcp api query responses for a limited time
+
+  The decorated function must take an api client as its first argument. The
+  cache key uses the identity of this client along with the remaining
+  arguments, and the client is held by the cache so that its id cannot be
+  reused while the entry exists. None responses are not cached.
+
+  Args:
+  ttl: time (in seconds) for which a cached response is valid
+
+  Returns:
+  decorator
+  """
+
+  def check(fn):
+
+    def wrapper(api, *args, **kwargs):
+      key = (fn.__name__, id(api), args, frozenset(kwargs.items()))
+      entry = _API_CACHE.get(key)
+      if entry is not None:
+        ts, _, response = entry
+        if monotonic() - ts < ttl:
+          return response
+
+      response = fn(api, *args, **kwargs)
+      if response is not None:
+        _API_CACHE[key] = (monotonic(), api, response)
+      return response
+
+    return wrapper
+
+  return check
+
+
+# ----------------------------------------------------------------------------
+def invalidate_api_cache() -> None:
+  """clears all cached gcp api responses
+
+  This should be called after any operation that modifies gcp resources.
+  """
+  _API_CACHE.clear()
+
+
 # ----------------------------------------------------------------------------
 def validate_gpu_spec_against_limits(
     gpu_spec: GPUSpec,
@@ -125,6 +207,99 @@ def nvidia_daemonset_url(node_image: NodeImage) -> Optional[str]:
   return DAEMONSETS.get(node_image, None)
 
 
+# ----------------------------------------------------------------------------
+def parse_yaml(data: Any) -> Any:
+  """parses yaml data, using the libyaml loader when available
+
+  Args:
+  data: yaml string, bytes, or open file
+
+  Returns:
+  parsed yaml data
+  """
+
+  return yaml.load(data, Loader=_YAML_LOADER)
+
+
+# ----------------------------------------------------------------------------
+@functools.lru_cache(maxsize=None)
+def _http_session() -> Any:
+  """gets the shared http session used for url fetches
+
+  Sharing a session lets repeated fetches reuse pooled connections rather
+  than paying for a new tls handshake each time.
+
+  Returns:
+  requests.Session instance
+  """
+
+  import requests
+  from requests.adapters import HTTPAdapter
+  from urllib3.util.retry import Retry
+
+  adapter = HTTPAdapter(
+      max_retries=Retry(total=k.URL_FETCH_RETRIES, backoff_factor=0.2))
+  session = requests.Session()
+  session.mount('https://', adapter)
+  session.mount('http://', adapter)
+  return session
+
+
+# ----------------------------------------------------------------------------
+@trap(None, silent=False)
+def fetch_url(url: str, cache_dir: str = k.URL_CACHE_DIR) -> Optional[bytes]:
+  """fetches data from url, caching it on disk
+
+  Cached data is revalidated using its etag, so unchanged data is not
+  downloaded again.
+
+  Args:
+  url: url for data
+  cache_dir: directory for cached data
+
+  Returns:
+  data on success, None otherwise
+  """
+
+  import requests
+
+  cache_dir = os.path.expanduser(cache_dir)
+  base = os.path.join(cache_dir, hashlib.sha256(url.encode()).hexdigest())
+  data_path = base + '.data'
+  etag_path = base + '.etag'
+
+  headers = {}
+  if os.path.exists(data_path) and os.path.exists(etag_path):
+    with open(etag_path, 'r') as f:
+      headers['If-None-Match'] = f.read()
+
+  response = _http_session().get(url,
+                                 headers=headers,
+                                 timeout=k.URL_FETCH_TIMEOUT_SEC)
+
+  if response.status_code == requests.codes.not_modified:
+    with open(data_path, 'rb') as f:
+      return f.read()
+
+  if response.status_code != requests.codes.ok:
+    logging.error('error getting data from {}'.format(url))
+    return None
+
+  os.makedirs(cache_dir, exist_ok=True)
+  if os.path.exists(etag_path):
+    os.remove(etag_path)
+
+  with open(data_path, 'wb') as f:
+    f.write(response.content)
+
+  etag = response.headers.get('ETag')
+  if etag is not None:
+    with open(etag_path, 'w') as f:
+      f.write(etag)
+
+  return response.content
+
+
 # ----------------------------------------------------------------------------
 def dashboard_cluster_url(cluster_id: str, zone: str, project_id: str):
   """returns gcp dashboard url for given cluster
@@ -142,6 +317,40 @@ def dashboard_cluster_url(cluster_id: str, zone: str, project_id: str):
   return '{}/{}/{}?{}'.format(k.DASHBOARD_CLUSTER_URL, zone, cluster_id, query)
 
 
+# ----------------------------------------------------------------------------
+def build_api(name: str, version: str,
+              creds: Credentials) -> discovery.Resource:
+  """gets a discovery api client
+
+  Building a client parses the api's discovery document (several MB for
+  compute), so clients are built once and reused for a given api and
+  credentials. Each client is given its own authorized http transport, so
+  that the underlying connection is reused across requests made with this
+  client. This transport is not thread-safe, so clients are not shared
+  between threads.
+
+  Args:
+  name: api name, e.g. 'compute'
+  version: api version, e.g. 'v1'
+  creds: credentials
+
+  Returns:
+  discovery api resource
+  """
+
+  key = (name, version, id(creds), threading.get_ident())
+  entry = _API_CLIENTS.get(key)
+  if entry is None:
+    # build_http sets the default socket timeout and redirect handling used
+    # by discovery.build(credentials=...)
+    http = google_auth_httplib2.AuthorizedHttp(creds, http=build_http())
+    entry = (creds,
+             discovery.build(name, version, http=http, cache_discovery=False))
+    _API_CLIENTS[key] = entry
+
+  return entry[1]
+
+
 # ----------------------------------------------------------------------------
 @trap(None)
 def get_tpu_drivers(tpu_api: discovery.Resource, project_id: str,
@@ -202,18 +411,25 @@ def wait_for_operation(cluster_api: discovery.Resource,
                        conditions: List[OpStatus] = [
                            OpStatus.DONE, OpStatus.ABORTING
                        ],
-                       sleep_sec: int = 1,
+                       sleep_sec: float = 1,
                        message: str = '',
-                       spinner: bool = True) -> Optional[dict]:
+                       spinner: bool = True,
+                       max_sleep_sec: float = k.OPERATION_MAX_POLL_SEC,
+                       deadline_sec: Optional[float] = None) -> Optional[dict]:
   """waits for cluster operation to reach given state(s)
 
+  The polling interval starts at sleep_sec and doubles (with a small random
+  jitter) after each poll, up to max_sleep_sec.
+
   Args:
   cluster_api: cluster api client
   name: operation name, of form projects/*/locations/*/operations/*
   conditions: exit status conditions
-  sleep_sec: polling interval
+  sleep_sec: initial polling interval
   message: wait message
   spinner: display spinner while waiting
+  max_sleep_sec: maximum polling interval
+  deadline_sec: maximum time to wait, None = wait indefinitely
 
   Returns:
   response dictionary on success, None otherwise
@@ -225,14 +441,24 @@ def wait_for_operation(cluster_api: discovery.Resource,
   condition_strings = [x.name for x in conditions]
 
   def _wait():
+    start = monotonic()
+    delay = sleep_sec
     while True:
       rsp = cluster_api.projects().locations().operations().get(
           name=name).execute()
 
+      if rsp is None:
+        return None
+
       if rsp['status'] in condition_strings:
         return rsp
 
-      sleep(sleep_sec)
+      if deadline_sec is not None and monotonic() - start > deadline_sec:
+        logging.error('timed out waiting for operation {}'.format(name))
+        return None
+
+      sleep(delay + random.uniform(0, delay * 0.1))
+      delay = min(delay * 2, max_sleep_sec)
 
   if spinner:
     with yaspin(Spinners.line, text=message) as spinner:
@@ -253,8 +479,7 @@ def gke_tpu_to_tpuspec(tpu: str) -> Optional[TPUSpec]:
   TPUSpec on success, None otherwise
   """
 
-  tpu_re = re.compile('^(?P<tpu>(v2|v3))-(?P<count>[0-9]+)$')
-  match = tpu_re.match(tpu)
+  match = k.TPU_RE.match(tpu)
   if match is None:
     return None
   gd = match.groupdict()
@@ -264,6 +489,7 @@ def gke_tpu_to_tpuspec(tpu: str) -> Optional[TPUSpec]:
 
 # ----------------------------------------------------------------------------
 @trap(None)
+@ttl_cache()
 def get_zone_tpu_types(tpu_api: discovery.Resource, project_id: str,
                        zone: str) -> Optional[List[TPUSpec]]:
   """gets list of tpus available in given zone
@@ -303,8 +529,7 @@ def gke_gpu_to_gpu(gpu: str) -> Optional[GPU]:
   GPU on success, None otherwise
   """
 
-  gpu_re = re.compile('^nvidia-tesla-(?P<type>[a-z0-9]+)$')
-  match = gpu_re.match(gpu)
+  match = k.GPU_RE.match(gpu)
   if match is None:
     return None
   gd = match.groupdict()
@@ -313,6 +538,7 @@ def gke_gpu_to_gpu(gpu: str) -> Optional[GPU]:
 
 # ----------------------------------------------------------------------------
 @trap(None)
+@ttl_cache()
 def get_zone_gpu_types(compute_api: discovery.Resource, project_id: str,
                        zone: str) -> Optional[List[GPUSpec]]:
   """gets list of gpu accelerators available in given zone
@@ -342,6 +568,7 @@ def get_zone_gpu_types(compute_api: discovery.Resource, project_id: str,
 
 # ----------------------------------------------------------------------------
 @trap(None, silent=False)
+@ttl_cache()
 def get_region_quotas(compute_api: discovery.Resource, project_id: str,
                       region: str) -> Optional[List[Dict[str, Any]]]:
   """gets compute quotas for given region
@@ -377,8 +604,6 @@ def resource_limits_from_quotas(
 
   limits = []
 
-  gpu_re = re.compile('^NVIDIA_(?P<gpu>[A-Z0-9]+)_GPUS$')
-
   for q in quotas:
     metric = q['metric']
     limit = int(q['limit'])
@@ -390,19 +615,27 @@ def resource_limits_from_quotas(
       continue
 
     if metric == 'CPUS':
-      limits.append({'resourceType': 'cpu', 'maximum': str(limit)})
-      limits.append({
-          'resourceType': 'memory',
-          'maximum': str(limit * k.MAX_GB_PER_CPU)
-      })
+      limits.extend((
+          {
+              'resourceType': 'cpu',
+              'maximum': str(limit)
+          },
+          {
+              'resourceType': 'memory',
+              'maximum': str(limit * k.MAX_GB_PER_CPU)
+          },
+      ))
       continue
 
-    gpu_match = gpu_re.match(metric)
-    if gpu_match is None:
+    if not (metric.startswith(k.GPU_QUOTA_PREFIX) and
+            metric.endswith(k.GPU_QUOTA_SUFFIX)):
       continue
 
-    gd = gpu_match.groupdict()
-    gpu_type = gd['gpu']
+    gpu_type = metric[len(k.GPU_QUOTA_PREFIX):-len(k.GPU_QUOTA_SUFFIX)]
+
+    # skip variants such as NVIDIA_K80_VWS_GPUS
+    if not gpu_type.isalnum():
+      continue
 
     limits.append({
         'resourceType': 'nvidia-tesla-{}'.format(gpu_type.lower()),
@@ -434,9 +667,26 @@ def generate_resource_limits(compute_api: discovery.Resource, project_id: str,
   return resource_limits_from_quotas(quotas)
 
 
+# ----------------------------------------------------------------------------
+@functools.lru_cache(maxsize=None)
+def k8s_serializer() -> 'ApiClient':
+  """gets a shared kubernetes api client for object serialization
+
+  Constructing an ApiClient sets up its configuration and connection pool, so
+  this shared instance should be used when only serialization is needed.
+
+  Returns:
+  ApiClient instance, not to be used for api requests
+  """
+
+  from kubernetes.client.api_client import ApiClient
+
+  return ApiClient()
+
+
 # ----------------------------------------------------------------------------
 @trap(None, silent=False)
-def job_to_dict(job: V1Job) -> Optional[dict]:
+def job_to_dict(job: 'V1Job') -> Optional[dict]:
   """convert V1Job to dictionary
 
   Note that this is *different* than what is returned by V1Job.to_dict().
@@ -450,7 +700,23 @@ def job_to_dict(job: V1Job) -> Optional[dict]:
   dictionary representation on success, None otherwise
   """
 
-  return ApiClient().sanitize_for_serialization(job)
+  return k8s_serializer().sanitize_for_serialization(job)
+
+
+# ----------------------------------------------------------------------------
+def _nonnull(x: Any) -> Any:
+  """recursively removes None-valued entries from dicts and lists in x"""
+
+  # exact class checks here to match only plain dicts and lists
+  cls = x.__class__
+
+  if cls is dict:
+    return {key: _nonnull(val) for key, val in x.items() if val is not None}
+
+  if cls is list:
+    return [_nonnull(val) for val in x if val is not None]
+
+  return x
 
 
 # ----------------------------------------------------------------------------
@@ -466,21 +732,7 @@ def nonnull_list(lst: list) -> list:
   list with None-valued entries removed
   """
 
-  nnl = []
-  for x in lst:
-    if x is None:
-      continue
-
-    new_x: Any = x
-
-    if type(x) == dict:
-      new_x = nonnull_dict(x)
-    elif type(x) == list:
-      new_x = nonnull_list(x)
-
-    nnl.append(new_x)
-
-  return nnl
+  return [_nonnull(x) for x in lst if x is not None]
 
 
 # ----------------------------------------------------------------------------
@@ -496,24 +748,11 @@ def nonnull_dict(d: dict) -> dict:
   dictionary with None-valued keys removed
   """
 
-  nnd = {}
-  for k, v in d.items():
-    if v is None:
-      continue
-    new_val: Any = v
-
-    if type(v) == dict:
-      new_val = nonnull_dict(v)
-    elif type(v) == list:
-      new_val = nonnull_list(v)
-
-    nnd[k] = new_val
-
-  return nnd
+  return {key: _nonnull(val) for key, val in d.items() if val is not None}
 
 
 # ----------------------------------------------------------------------------
-def job_str(job: V1Job) -> str:
+def job_str(job: 'V1Job') -> str:
   """formats job string to remove all default (None) values
 
   Args:
@@ -522,7 +761,7 @@ def job_str(job: V1Job) -> str:
   Returns:
   string describing job
   """
-  return pp.pformat(nonnull_dict(job_to_dict(job)), indent=2, width=80)
+  return pformat(nonnull_dict(job_to_dict(job)), indent=2, width=80)
 
 
 # ----------------------------------------------------------------------------
@@ -551,7 +790,7 @@ def validate_job_filename(s: str) -> str:
 
 # ----------------------------------------------------------------------------
 @trap(False, silent=False)
-def export_job(job: V1Job, filename: str) -> bool:
+def export_job(job: 'V1Job', filename: str) -> bool:
   """exports job as a kubernetes job spec to file
 
   The output format is determined from the file extension.
@@ -605,32 +844,21 @@ def sanitize_job_name(name: str) -> str:
 
   name = name.lower()
 
-  # ugh, in python '²'.isalnum() returns True, so can't use isalnum
-  # also, DNS-1123 is restricted, so just use re here
-
-  def _valid(name):
-    return k.DNS_1123_RE.match(name) is not None
-
-  alnum_re = re.compile('[a-z0-9]')
-  invalid_re = re.compile('[^a-z0-9\-\.]')
-
-  def _alnum(x):
-    return alnum_re.match(x) is not None
-
   # already valid, so done
-  if _valid(name):
+  if k.DNS_1123_RE.match(name) is not None:
     return name
 
+  # ugh, in python '²'.isalnum() returns True, so can't use isalnum here
   # first char must be alnum
-  if not _alnum(name[0]):
+  if name[0] not in _DNS_1123_ALNUM:
     name = 'job-' + name
 
   # last char must be alnum
-  if not _alnum(name[-1]):
+  if name[-1] not in _DNS_1123_ALNUM:
     name = name + '-0'
 
   # replace all invalid chars with '-'
-  return invalid_re.sub('-', name)
+  return name.translate(_DNS_1123_TRANSLATION)
 
 
 # ----------------------------------------------------------------------------
@@ -715,11 +943,37 @@ def credentials(creds_file: Optional[str] = None) -> CredentialsData:
   return credentials_from_file(creds_file)
 
 
+# ----------------------------------------------------------------------------
+@trap(None)
+@ttl_cache()
+def get_cluster_details(container_api: discovery.Resource, project_id: str,
+                        zone: str, name: str) -> Optional[Dict[str, Any]]:
+  """gets cluster details from the container api
+
+  Unlike the cluster manager client, this includes the autoprovisioning
+  configuration for the cluster.
+
+  Args:
+  container_api: container api client
+  project_id: project id
+  zone: cluster zone
+  name: cluster name
+
+  Returns:
+  cluster details dictionary on success, None otherwise
+  """
+
+  return container_api.projects().locations().clusters().get(
+      name='projects/{}/locations/{}/clusters/{}'.format(
+          project_id, zone, name)).execute()
+
+
 # --------------------------------------------------------------------------
 @trap(None)
-def get_gke_clusters(client: ClusterManagerClient,
+@ttl_cache()
+def get_gke_clusters(client: 'ClusterManagerClient',
                      project_id: str,
-                     zone: str = '-') -> Optional[List[GKECluster]]:
+                     zone: str = '-') -> Optional[List['GKECluster']]:
   """gets list of gcp clusters for given project, zone
 
   Args:
@@ -736,10 +990,10 @@ def get_gke_clusters(client: ClusterManagerClient,
 
 # ----------------------------------------------------------------------------
 @trap(None)
-def get_gke_cluster(client: ClusterManagerClient,
+def get_gke_cluster(client: 'ClusterManagerClient',
                     name: str,
                     project_id: str,
-                    zone: str = '-') -> Optional[GKECluster]:
+                    zone: str = '-') -> Optional['GKECluster']:
   """gets specific cluster instance by name
 
   Args:
@@ -759,6 +1013,108 @@ def get_gke_cluster(client: ClusterManagerClient,
       ))
 
 
+# ----------------------------------------------------------------------------
+def cluster_cache_key(project_id: str, zone: str, name: str) -> str:
+  """generates the cluster cache key for given cluster
+
+  Args:
+  project_id: project id
+  zone: zone, - = all zones
+  name: cluster name
+
+  Returns:
+  cache key string
+  """
+
+  return '{}/{}/{}'.format(project_id, zone, name)
+
+
+# ----------------------------------------------------------------------------
+@trap(None)
+def read_cluster_cache(key: str,
+                       path: str = k.CLUSTER_CACHE_FILE
+                      ) -> Optional[Dict[str, str]]:
+  """reads cluster connection info from the on-disk cluster cache
+
+  Args:
+  key: cache key, see cluster_cache_key()
+  path: cache file path
+
+  Returns:
+  connection info dictionary if a valid, unexpired entry exists,
+  None otherwise
+  """
+
+  path = os.path.expanduser(path)
+  if not os.path.exists(path):
+    return None
+
+  with open(path, 'r') as f:
+    fcntl.flock(f, fcntl.LOCK_SH)
+    cache = json.load(f)
+
+  entry = cache.get(key)
+  if entry is None:
+    return None
+
+  if entry['expiry'] < time() + k.CLUSTER_CACHE_MIN_TTL_SEC:
+    return None
+
+  return entry.get('info')
+
+
+# ----------------------------------------------------------------------------
+@trap(False)
+def write_cluster_cache(key: str,
+                        info: Optional[Dict[str, str]],
+                        expiry: float = 0,
+                        path: str = k.CLUSTER_CACHE_FILE) -> bool:
+  """writes cluster connection info to the on-disk cluster cache
+
+  The cache file is locked during the update, so concurrent caliban
+  processes may safely share it. Expired entries are pruned on each write,
+  and a corrupt cache file is replaced.
+
+  Args:
+  key: cache key, see cluster_cache_key()
+  info: connection info dictionary, None removes the entry for key
+  expiry: expiration time of entry, in seconds since the epoch
+  path: cache file path
+
+  Returns:
+  True on success, False otherwise
+  """
+
+  path = os.path.expanduser(path)
+  os.makedirs(os.path.dirname(path), exist_ok=True)
+
+  # connection info includes the cluster ca certificate, so keep this private
+  fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+  with os.fdopen(fd, 'r+') as f:
+    fcntl.flock(f, fcntl.LOCK_EX)
+    content = f.read()
+
+    now = time()
+    try:
+      cache = json.loads(content) if content else {}
+      cache = {x: v for x, v in cache.items() if v['expiry'] > now}
+    except (ValueError, AttributeError, KeyError, TypeError):
+      # start over with a corrupt cache, otherwise it would never be updated
+      logging.debug('discarding corrupt cluster cache {}'.format(path))
+      cache = {}
+
+    if info is None:
+      cache.pop(key, None)
+    else:
+      cache[key] = {'info': info, 'expiry': expiry}
+
+    f.seek(0)
+    f.truncate()
+    json.dump(cache, f)
+
+  return True
+
+
 # ----------------------------------------------------------------------------
 def parse_job_file(job_file: str) -> Optional[dict]:
   '''parses a kubernetes job spec file
@@ -787,7 +1143,7 @@ def parse_job_file(job_file: str) -> Optional[dict]:
         job_spec = json.load(f)
     else:
       with open(job_file, 'r') as f:
-        job_spec = yaml.load(f, Loader=yaml.FullLoader)
+        job_spec = parse_yaml(f)
 
   except Exception as e:
     logging.error('error loading job file {}:\n{}'.format(job_file, e))
@@ -20,9 +20,6 @@ and notebooks in a Docker environment.
 
 from __future__ import absolute_import, division, print_function
 
-from datetime import datetime
-import json
-import os
 import subprocess
 import sys
 import traceback
@@ -36,7 +33,6 @@ from tqdm.utils import _screen_shape_wrapper
 import caliban.config as c
 import caliban.config.experiment as ce
 import caliban.docker.build as b
-import caliban.util as u
 import caliban.util.fs as ufs
 import caliban.util.metrics as um
 import caliban.util.tqdm as ut
@@ -101,6 +101,21 @@ def parse_kv_pair(s: str) -> Tuple[str, str]:
   return (k, v)
 
 
+def positive_int(s: str) -> int:
+  """argparse type that accepts only integers greater than zero."""
+  try:
+    v = int(s)
+  except ValueError:
+    raise argparse.ArgumentTypeError(
+        "'{}' is not a valid integer.".format(s)) from None
+
+  if v <= 0:
+    raise argparse.ArgumentTypeError(
+        "'{}' must be a positive integer.".format(s))
+
+  return v
+
+
 def is_key(k: Optional[str]) -> bool:
   """Returns True if the argument is a valid argparse optional arg input, False
   otherwise.
@@ -24,7 +24,6 @@ import json
 import os
 
 import caliban.util as u
-import caliban.history.types as ht
 from contextlib import contextmanager
 from typing import Dict, Any, List, Optional
 
@@ -103,6 +103,15 @@ def test_expand_experiment_config():
   assert [{}] == c.expand_experiment_config({})
 
 
+def test_iter_experiment_config():
+  config = [{'a': [1, 2], 'b': 'c'}, {'[d,e]': [[1, 2], [3, 4]]}]
+
+  # experiments are generated lazily, in the same order as the expanded list
+  it = c.iter_experiment_config(config)
+  assert next(it) == {'a': 1, 'b': 'c'}
+  assert list(it) == c.expand_experiment_config(config)[1:]
+
+
 def test_compound_key_handling():
   """tests the full assembly line transforming a configuration dictionary
     including compound keys into a list of dictionaries for passing to the
@@ -19,6 +19,7 @@ import unittest
 from typing import List, Optional, Dict
 from unittest import mock
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 import json
 import os
 import tempfile
@@ -279,6 +280,50 @@ class UtilTestSuite(unittest.TestCase):
 
     return
 
+  # --------------------------------------------------------------------------
+  def test_wait_for_operation_backoff(self):
+    """tests wait_for_operation polling backoff and deadline"""
+
+    class mock_api:
+
+      def projects(self):
+        return self
+
+      def locations(self):
+        return self
+
+      def operations(self):
+        return self
+
+      def get(self, name):
+        return self
+
+      def execute(self):
+        return {'status': OpStatus.RUNNING.value}
+
+    # fake clock, advanced by each sleep
+    now = [0.0]
+    sleeps = []
+
+    def _sleep(x):
+      sleeps.append(x)
+      now[0] += x
+
+    with mock.patch.object(util, 'sleep', _sleep), \
+         mock.patch.object(util, 'monotonic', lambda: now[0]), \
+         mock.patch.object(util.random, 'uniform', lambda a, b: 0):
+      self.assertIsNone(
+          util.wait_for_operation(mock_api(),
+                                  'name', [OpStatus.DONE],
+                                  sleep_sec=1,
+                                  spinner=False,
+                                  max_sleep_sec=8,
+                                  deadline_sec=60))
+
+    self.assertEqual([1, 2, 4, 8, 8, 8, 8, 8, 8, 8], sleeps)
+
+    return
+
   # --------------------------------------------------------------------------
   @given(
       st.sets(
@@ -471,6 +516,7 @@ class UtilTestSuite(unittest.TestCase):
     self.assertEqual([], util.get_region_quotas(api, 'p', 'r'))
 
     # normal execution
+    util.invalidate_api_cache()
     api.execute = _normal
     self.assertEqual(_normal()['quotas'], util.get_region_quotas(api, 'p', 'r'))
 
@@ -518,6 +564,7 @@ class UtilTestSuite(unittest.TestCase):
     self.assertEqual([], util.generate_resource_limits(api, 'p', 'r'))
 
     # normal execution
+    util.invalidate_api_cache()
     api.execute = _normal
     quotas = _normal()['quotas']
     expected = ([{
@@ -688,6 +735,47 @@ def test_dashboard_cluster_url():
                  f'?project={cfg["project_id"]}')
 
 
+# ----------------------------------------------------------------------------
+def test_ttl_cache(monkeypatch):
+  calls = []
+
+  @util.ttl_cache(ttl=10)
+  def _query(api, x):
+    calls.append(x)
+    return api.get(x)
+
+  api = {'a': 1}
+  other_api = {'a': 2}
+  now = [0.0]
+  monkeypatch.setattr(util, 'monotonic', lambda: now[0])
+
+  util.invalidate_api_cache()
+
+  # repeated queries are served from the cache
+  assert _query(api, 'a') == 1
+  assert _query(api, 'a') == 1
+  assert calls == ['a']
+
+  # distinct api clients do not share entries
+  assert _query(other_api, 'a') == 2
+  assert calls == ['a', 'a']
+
+  # None responses are not cached
+  assert _query(api, 'b') is None
+  assert _query(api, 'b') is None
+  assert calls == ['a', 'a', 'b', 'b']
+
+  # expired entries are refreshed
+  now[0] = 11.0
+  assert _query(api, 'a') == 1
+  assert calls == ['a', 'a', 'b', 'b', 'a']
+
+  # invalidation clears everything
+  util.invalidate_api_cache()
+  assert _query(api, 'a') == 1
+  assert len(calls) == 6
+
+
 # ----------------------------------------------------------------------------
 def test_get_tpu_drivers(monkeypatch):
 
@@ -733,7 +821,9 @@ def test_resource_limits_from_quotas():
   # valid, all quota > 0
   counts = {'cpu': 1, 'nvidia-tesla-p100': 2, 'memory': k.MAX_GB_PER_CPU}
   quotas = [('CPUS', counts['cpu']),
-            ('NVIDIA_P100_GPUS', counts['nvidia-tesla-p100']), ('bogus', 5)]
+            ('NVIDIA_P100_GPUS', counts['nvidia-tesla-p100']), ('bogus', 5),
+            ('NVIDIA_P100_VWS_GPUS', 3), ('PREEMPTIBLE_NVIDIA_P100_GPUS', 4),
+            ('NVIDIA_GPUS', 6)]
   cfg = {'quotas': [{'metric': x[0], 'limit': x[1]} for x in quotas]}
 
   q = util.resource_limits_from_quotas(**cfg)
@@ -951,6 +1041,143 @@ def test_credentials(monkeypatch):
     assert cd.project_id == project_id
 
 
+# ----------------------------------------------------------------------------
+def test_get_cluster_details():
+  names = []
+
+  class mock_api:
+
+    def projects(self):
+      return self
+
+    def locations(self):
+      return self
+
+    def clusters(self):
+      return self
+
+    def get(self, name):
+      names.append(name)
+      return self
+
+    def execute(self):
+      return {'name': names[-1]}
+
+  util.invalidate_api_cache()
+  api = mock_api()
+  d = util.get_cluster_details(api, 'p', 'z', 'c')
+  assert d == {'name': 'projects/p/locations/z/clusters/c'}
+
+  # repeated queries are cached
+  assert util.get_cluster_details(api, 'p', 'z', 'c') == d
+  assert len(names) == 1
+
+  util.invalidate_api_cache()
+  assert util.get_cluster_details(api, 'p', 'z', 'c') == d
+  assert len(names) == 2
+
+
+# ----------------------------------------------------------------------------
+def test_build_api(monkeypatch):
+  monkeypatch.setattr(util.discovery, 'build', lambda *args, **kwargs: object())
+
+  creds = google.auth.credentials.AnonymousCredentials()
+  compute_api = util.build_api('compute', 'v1', creds)
+
+  # clients are reused for the same api and credentials
+  assert util.build_api('compute', 'v1', creds) is compute_api
+  assert util.build_api('tpu', 'v1', creds) is not compute_api
+  assert util.build_api(
+      'compute', 'v1',
+      google.auth.credentials.AnonymousCredentials()) is not compute_api
+
+  # ...but not between threads
+  with ThreadPoolExecutor(max_workers=1) as executor:
+    other = executor.submit(util.build_api, 'compute', 'v1', creds).result()
+  assert other is not compute_api
+
+
+# ----------------------------------------------------------------------------
+def test_cluster_cache(monkeypatch):
+  now = [1000.0]
+  monkeypatch.setattr(util, 'time', lambda: now[0])
+
+  key = util.cluster_cache_key('p', 'z', 'c')
+  other_key = util.cluster_cache_key('p', 'z', 'd')
+
+  with tempfile.TemporaryDirectory() as tmpdir:
+    path = os.path.join(tmpdir, 'cache', 'clusters.json')
+
+    # no cache file
+    assert util.read_cluster_cache(key, path) is None
+
+    info = {'endpoint': '1.2.3.4', 'cluster_ca_certificate': 'ca'}
+    assert util.write_cluster_cache(key, info, 2000, path)
+    assert util.write_cluster_cache(other_key, info, 1010, path)
+    assert util.read_cluster_cache(key, path) == info
+    assert oct(os.stat(path).st_mode & 0o777) == oct(0o600)
+
+    # entries close to expiry are not used
+    assert util.read_cluster_cache(other_key, path) is None
+
+    # removal
+    assert util.write_cluster_cache(key, None, path=path)
+    assert util.read_cluster_cache(key, path) is None
+
+    # expired entries are pruned on write
+    now[0] = 1020.0
+    assert util.write_cluster_cache(key, info, 2000, path)
+    with open(path) as f:
+      assert list(json.load(f).keys()) == [key]
+
+    # a corrupt cache file is replaced on write
+    for garbage in ['{not json', '[]', '{"x": 1}']:
+      with open(path, 'w') as f:
+        f.write(garbage)
+      assert util.read_cluster_cache(key, path) is None
+      assert util.write_cluster_cache(key, info, 2000, path)
+      assert util.read_cluster_cache(key, path) == info
+
+
+# ----------------------------------------------------------------------------
+def test_fetch_url():
+
+  class mock_response:
+
+    def __init__(self, status_code, content=b'', etag=None):
+      self.status_code = status_code
+      self.content = content
+      self.headers = {'ETag': etag} if etag is not None else {}
+
+  url = 'https://example.com/daemonset.yaml'
+
+  with tempfile.TemporaryDirectory() as tmpdir:
+    with mock.patch('requests.Session.get') as mocked_get:
+
+      # error
+      mocked_get.return_value = mock_response(404)
+      assert util.fetch_url(url, cache_dir=tmpdir) is None
+
+      # initial fetch, no cached etag
+      mocked_get.return_value = mock_response(200, b'foo: 1', etag='"abc"')
+      assert util.fetch_url(url, cache_dir=tmpdir) == b'foo: 1'
+      assert 'If-None-Match' not in mocked_get.call_args[1]['headers']
+
+      # unchanged, served from cache
+      mocked_get.return_value = mock_response(304)
+      assert util.fetch_url(url, cache_dir=tmpdir) == b'foo: 1'
+      assert mocked_get.call_args[1]['headers']['If-None-Match'] == '"abc"'
+
+      # changed, without an etag
+      mocked_get.return_value = mock_response(200, b'foo: 2')
+      assert util.fetch_url(url, cache_dir=tmpdir) == b'foo: 2'
+      assert util.parse_yaml(b'foo: 2') == {'foo': 2}
+
+      mocked_get.return_value = mock_response(200, b'foo: 3')
+      assert util.fetch_url(url, cache_dir=tmpdir) == b'foo: 3'
+      assert 'If-None-Match' not in mocked_get.call_args[1]['headers']
+
+
 # ----------------------------------------------------------------------------
 def test_parse_job_file():
 
@@ -14,7 +14,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
 import unittest
+from contextlib import redirect_stderr
 
 import caliban.cli as c
 import caliban.platform.cloud.types as ct
@@ -24,6 +26,38 @@ from caliban.config import JobMode
 class CLITestSuite(unittest.TestCase):
   """Tests for caliban.cli."""
 
+  def test_cluster_parser(self):
+    """Only the requested command parsers are built, but every command still
+    parses."""
+    self.assertEqual(c._sniff_command(['cluster', 'job', 'ls'], c._COMMANDS),
+                     'cluster')
+    self.assertEqual(c._sniff_command(['job', 'ls'], c._CLUSTER_CMDS), 'job')
+    self.assertIsNone(c._sniff_command(['--verbosity', '1', 'run'],
+                                       c._COMMANDS))
+    self.assertIsNone(c._sniff_command(['bogus'], c._CLUSTER_CMDS))
+    self.assertIsNone(c._sniff_command([], c._CLUSTER_CMDS))
+    self.assertIsNone(c._sniff_command(None, c._COMMANDS))
+    self.assertIsNone(c._sniff_command(['-h', 'run'], c._COMMANDS))
+    self.assertEqual(c._sniff_command(['run', '-h'], c._COMMANDS), 'run')
+
+    for cmd in ['ls', 'create', 'delete']:
+      argv = ['cluster', cmd, '--zone', 'us-central1-a']
+      args = vars(c.caliban_parser(argv).parse_args(argv))
+      self.assertEqual(args['cluster_cmd'], cmd)
+      self.assertEqual(args['zone'], 'us-central1-a')
+
+    argv = ['cluster', 'pod', 'ls', '--label_selector', 'a=b']
+    args = vars(c.caliban_parser(argv).parse_args(argv))
+    self.assertEqual(args['pod_cmd'], 'ls')
+    self.assertEqual(args['label_selector'], 'a=b')
+
+    # usage lines still list every command, not just the requested one
+    argv = ['cluster', 'ls', '--bogus']
+    stderr = io.StringIO()
+    with self.assertRaises(SystemExit), redirect_stderr(stderr):
+      c.caliban_parser(argv).parse_args(argv)
+    self.assertIn('{' + ','.join(c._COMMANDS) + '}', stderr.getvalue())
+
   def test_job_mode(self):
     """Tests for all possible combinations of the three arguments to
     resolve_job_mode.
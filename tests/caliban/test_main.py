@@ -0,0 +1,38 @@
+#!/usr/bin/python
+#
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""unit tests for caliban.main"""
+
+import caliban.cli as cli
+import caliban.docker.build as b
+import caliban.main as m
+from caliban.config import JobMode
+
+
+def test_run_app_build(monkeypatch, tmp_path):
+  """the build command dispatches to docker.build.build_image"""
+  monkeypatch.chdir(tmp_path)
+  (tmp_path / 'foo.py').write_text('')
+
+  calls = []
+  monkeypatch.setattr(b, 'build_image', lambda *args, **kwargs: calls.append(
+      (args, kwargs)))
+
+  m.run_app(cli.parse_flags(['caliban', 'build', '--nogpu', 'foo.py']))
+
+  assert len(calls) == 1
+  args, kwargs = calls[0]
+  assert args == (JobMode.CPU,)
+  assert kwargs['package'].script_path == 'foo.py'
@@ -14,8 +14,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import argparse
 from collections import OrderedDict
 
+import pytest
+
 import caliban.util.argparse as ua
 
 
@@ -40,3 +43,11 @@ def test_is_key():
   # this should never happen, but what the heck, why not test that it's a
   # fine thing, accepted yet strange.
   assert ua.is_key("-----face")
+
+
+def test_positive_int():
+  assert ua.positive_int("4") == 4
+
+  for s in ["0", "-1", "1.5", "face"]:
+    with pytest.raises(argparse.ArgumentTypeError):
+      ua.positive_int(s)